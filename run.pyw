@@ -1,4 +1,4 @@
-from src.main import main
-
 if __name__ == "__main__":
+    from src.main import main
+
     main()
@@ -1,4 +1,5 @@
-from typing import Callable, Optional
+from collections import deque
+from typing import Callable, Iterable, Iterator, Optional
 from enum import Enum
 import math
 import pygame
@@ -26,6 +27,9 @@ class Animation(Enum):
 
 AnimationCallback = Callable[[], None]
 
+# Streamed nodes falling further behind than this (ms) are not caught up
+MAX_LAG = 100
+
 
 class AnimatingNode:
     def __init__(
@@ -73,18 +77,35 @@ class Animator:
         self.nodes_to_animate: dict[tuple[int, int], list[AnimatingNode]] = {}
         self.need_update = False
 
+        # Node iterators (with their delay and gap) scheduled as they go
+        self.streams: deque[tuple[Iterator[AnimatingNode], int, int]] = \
+            deque()
+
+        # When the next node of the first stream is due, None before its
+        # first node
+        self.stream_ticks: int | None = None
+
     def add_nodes_to_animate(
         self,
-        nodes: list[AnimatingNode],
+        nodes: Iterable[AnimatingNode],
         delay: int = 0,
         gap: int = 10
     ) -> None:
         """Add nodes for animation
 
+        A list is scheduled at once. Any other iterable is consumed lazily,
+        one node each time the previous one is due, after earlier
+        streams; it should only be used for nodes that may be created
+        late, like the cells of a search still running.
+
         Args:
-            nodes (list[AnimatingNode]): List of nodes
+            nodes (Iterable[AnimatingNode]): List or stream of nodes
             delay (bool, optional): Whether to wait for previous nodes to animate. Defaults to False.
         """
+        if not isinstance(nodes, list):
+            self.streams.append((iter(nodes), delay, gap))
+            self.feed()
+            return
 
         # Update first node's ticks and add it to the list
         if len(self.nodes_to_animate):
@@ -108,9 +129,43 @@ class Animator:
 
         self.need_update = True
 
+    def feed(self) -> None:
+        """Schedule the streamed nodes that are due
+        """
+        now = pygame.time.get_ticks()
+
+        while self.streams:
+            nodes, delay, gap = self.streams[0]
+
+            if self.stream_ticks is None:
+                # First node follows the nodes already scheduled
+                self.stream_ticks = now
+                if self.nodes_to_animate:
+                    last_node = list(self.nodes_to_animate.values())[-1][0]
+                    self.stream_ticks = last_node.ticks + delay
+            elif self.stream_ticks > now:
+                return
+
+            # Resume at the normal pace after a slow node
+            self.stream_ticks = max(self.stream_ticks, now - MAX_LAG)
+
+            node = next(nodes, None)
+            if node is None:
+                self.streams.popleft()
+                self.stream_ticks = None
+                continue
+
+            node.ticks = self.stream_ticks
+            node.time_updated = True
+            self.nodes_to_animate.setdefault(node.center, []).append(node)
+
+            self.stream_ticks += gap
+
     def animate_nodes(self):
         """Animate nodes in the nodes_to_animate list
         """
+        self.feed()
+
         # Update starting time for animating nodes
         if self.need_update:
             for center in self.nodes_to_animate:
@@ -175,6 +230,36 @@ class Animator:
                 if node.after_animation:
                     node.after_animation()
 
+    def finish(self) -> None:
+        """Skip the remaining animations and apply their final values
+        """
+        while self.nodes_to_animate or self.streams:
+            nodes = [node for center in self.nodes_to_animate
+                     for node in self.nodes_to_animate[center]]
+            self.nodes_to_animate.clear()
+
+            # Later nodes of a cell overwrite earlier ones
+            for node in sorted(nodes, key=lambda node: node.ticks):
+                self._finish_node(node)
+
+            # Streamed nodes come after the scheduled ones
+            self.stream_ticks = None
+            while self.streams:
+                for node in self.streams.popleft()[0]:
+                    self._finish_node(node)
+
+    def _finish_node(self, node: AnimatingNode) -> None:
+        """Apply the final value of a node without animating it
+
+        Args:
+            node (AnimatingNode): Node
+        """
+        pos = self.maze.get_cell_pos(node.center)
+        self.maze.set_cell(pos, node.value)
+
+        if node.after_animation:
+            node.after_animation()
+
     def _wall_animation(self, node: AnimatingNode) -> None:
         """Handle wall animation
 
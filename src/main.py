@@ -4,7 +4,10 @@ import pygame
 from .state import State
 from .generate import MazeGenerator
 from .animations import Animation, Animator, AnimatingNode
-from .maze import GOAL, START, Maze, WEIGHT
+from .maze import ALGORITHMS, GOAL, START, Maze, WEIGHT
+from .pathfinder.models.solution import Solution
+from .pathfinder.parallel import compare
+from .pathfinder.scheduler import SearchScheduler
 
 from .widgets import (
     Alignment,
@@ -62,6 +65,9 @@ state = State()
 maze = Maze(surface=WINDOW)
 animator = Animator(surface=WINDOW, maze=maze)
 maze_generator = MazeGenerator(animator=animator)
+
+# Runs searches that are not animated a few milliseconds per frame
+scheduler = SearchScheduler()
 maze.animator = animator
 maze.generator = maze_generator
 
@@ -128,6 +134,69 @@ algo_menu = Menu(
             foreground_color=pygame.Color(*WHITE),
             font_size=20, outline=False
         ),
+        Button(
+            surface=WINDOW,
+            text="Bidirectional BFS",
+            x=algorithm_btn.rect.x - 40,
+            y=0,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
+        Button(
+            surface=WINDOW,
+            text="Bidirectional A* Search",
+            x=algorithm_btn.rect.x - 40,
+            y=0,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
+        Button(
+            surface=WINDOW,
+            text="Jump Point Search",
+            x=algorithm_btn.rect.x - 40,
+            y=0,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
+        Button(
+            surface=WINDOW,
+            text="HPA* Search",
+            x=algorithm_btn.rect.x - 40,
+            y=0,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
+        Button(
+            surface=WINDOW,
+            text="ALT Search",
+            x=algorithm_btn.rect.x - 40,
+            y=0,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
+        Button(
+            surface=WINDOW,
+            text="D* Lite",
+            x=algorithm_btn.rect.x - 40,
+            y=0,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
+        Button(
+            surface=WINDOW,
+            text="Flow Field",
+            x=algorithm_btn.rect.x - 40,
+            y=0,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
     ]
 )
 
@@ -221,6 +290,15 @@ comapre_menu = Menu(
             foreground_color=pygame.Color(*WHITE),
             font_size=20, outline=False
         ),
+        Button(
+            surface=WINDOW,
+            text="Different Mazes (Parallel)",
+            x=0,
+            y=0,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
     ]
 )
 
@@ -395,6 +473,9 @@ def main() -> None:
                 row, col = maze.get_cell_pos(pos)
 
                 if cell_under_mouse != (row, col):
+                    # A running search must not see the grid change
+                    stop_search()
+
                     if maze.get_cell_value((row, col)) in ("1", "V", "*"):
                         rect = pygame.Rect(0, 0, MIN_SIZE, MIN_SIZE)
                         x, y = maze.coords[row][col]
@@ -432,12 +513,17 @@ def main() -> None:
                     cell_under_mouse = (row, col)
 
         # Animate nodes
-        if animator.nodes_to_animate and state.need_update:
+        if (animator.nodes_to_animate or animator.streams) \
+                and state.need_update:
             animator.animating = True
             animator.animate_nodes()
         else:
             animator.animating = False
 
+        # Advance searches that are not animated and show progress
+        scheduler.step()
+        show_progress()
+
         # Handle moving start and target nodes
         if dragging and not state.done_visualising and not animator.animating:
             x, y = pygame.mouse.get_pos()
@@ -458,8 +544,7 @@ def main() -> None:
                     maze.set_cell((row, col), cell_value)
                     maze.set_cell(cell_under_mouse, "1")
 
-                    text = state.label.text.split(" took")[0]
-                    instant_algorithm(maze, text)
+                    instant_algorithm(maze, selected_algorithm())
                     cell_under_mouse = (row, col)
 
         # Update
@@ -470,30 +555,102 @@ def main() -> None:
 def instant_algorithm(maze: Maze, algo_name: str):
     """Find path without animation
 
+    The search runs a slice per frame (see `scheduler`), replacing any
+    search still running for an earlier position.
+
     Args:
         maze (Maze): Maze
         algo_name (str): Algorithm name
     """
+    stop_search()
     maze.clear_visited()
 
-    solution = maze.solve(algo_name=algo_name)
+    stream = maze.stream(algo_name)
 
-    path = solution.path
-    explored = solution.explored
+    def mark_explored(cells: list[tuple[int, int]]):
+        # Mark explored nodes as blue
+        for i, j in cells:
+            if (i, j) in (maze.start, maze.goal):
+                continue
 
-    # Mark explored nodes as blue
-    for i, j in explored:
-        if (i, j) in (maze.start, maze.goal):
-            continue
+            maze.set_cell((i, j), "V")
 
-        maze.set_cell((i, j), "V")
+    def mark_path(solution: Solution):
+        state.search = None
 
-    # Mark optimal path nodes as yellow
-    for i, j in path:
-        if (i, j) in (maze.start, maze.goal):
-            continue
+        # Mark optimal path nodes as yellow
+        for i, j in solution.path:
+            if (i, j) in (maze.start, maze.goal):
+                continue
 
-        maze.set_cell((i, j), "*")
+            maze.set_cell((i, j), "*")
+
+        state.label = Label(
+            f"{algo_name} took {solution.explored_length} steps in "
+            f"{solution.time:.2f}ms", "center", 0,
+            background_color=pygame.Color(*WHITE),
+            foreground_color=pygame.Color(*DARK),
+            padding=6, font_size=20, outline=False,
+            surface=WINDOW,
+        )
+        state.label.rect.bottom = HEADER_HEIGHT - 10
+
+    state.search = (algo_name, stream)
+    scheduler.start(stream, on_cells=mark_explored, on_done=mark_path)
+
+
+def selected_algorithm() -> str:
+    """Get the name of the algorithm shown in the header label
+
+    Returns:
+        str: Algorithm name
+    """
+    text = state.label.text.split(" took")[0].split(" (")[0]
+    return text.split("Running ")[-1]
+
+
+def stop_search() -> None:
+    """Stop the search running without animation, if any
+    """
+    scheduler.cancel()
+
+    if not state.search:
+        return
+
+    state.label = Label(
+        state.search[0], "center", 0,
+        background_color=pygame.Color(*WHITE),
+        foreground_color=pygame.Color(*DARK),
+        padding=6, font_size=20, outline=False,
+        surface=WINDOW,
+    )
+    state.label.rect.bottom = HEADER_HEIGHT - 10
+    state.search = None
+
+
+def show_progress() -> None:
+    """Show how many cells the running search explored in the header
+    label
+    """
+    if not state.search:
+        return
+
+    name, stream = state.search
+    if stream.solution is not None:
+        return
+
+    text = f"Running {name} ({stream.explored} cells explored)"
+    if state.label.text == text:
+        return
+
+    state.label = Label(
+        text, "center", 0,
+        background_color=pygame.Color(*WHITE),
+        foreground_color=pygame.Color(*DARK),
+        padding=6, font_size=20, outline=False,
+        surface=WINDOW,
+    )
+    state.label.rect.bottom = HEADER_HEIGHT - 10
 
 
 def get_pressed() -> tuple[bool, int | None]:
@@ -613,13 +770,13 @@ def draw() -> None:
             and not maze.animator.animating:
         state.overlay = True
 
-        text = state.label.text.split(" took")[0]
-        text = text.split("Running ")[-1]
+        text = selected_algorithm()
         idx = [algo_menu.children.index(btn)
                for btn in algo_menu.children if btn.text == text][0]
         run_single(idx)
 
     if clear_btn.draw() and not maze.animator.animating:
+        stop_search()
         maze.clear_board()
         state.done_visualising = False
         state.need_update = True
@@ -637,12 +794,17 @@ def draw() -> None:
             state.run_all_mazes = True
             state.results = {}
             run_all(0)
+        elif comapre_menu.selected \
+                and comapre_menu.selected.text == "Different Mazes (Parallel)":
+            state.results = {}
+            run_parallel()
 
     if (generate_menu.draw() or generate_menu.clicked) \
             and not animator.animating:
         state.overlay = True
 
         if generate_menu.selected:
+            stop_search()
             maze.clear_board()
             text = state.label.text
 
@@ -693,15 +855,23 @@ def run_single(idx: int) -> None:
     Args:
         idx (int): Algorithm index
     """
+    stop_search()
     maze.clear_visited()
     text = algo_menu.children[idx].text
-    solution = maze.solve(text)
+    stream = maze.stream(text)
 
     def callback():
+        solution = stream.solution
+        state.search = None
         state.done_visualising = True
+
+        message = f"{text} took {solution.explored_length} steps in " \
+            f"{solution.time:.2f}ms"
+        if solution.preprocessing_time:
+            message += f" ({solution.preprocessing_time:.2f}ms preprocessing)"
+
         state.label = Label(
-            f"{text} took {solution.explored_length} steps in "
-            f"{solution.time:.2f}ms", "center", 0,
+            message, "center", 0,
             background_color=pygame.Color(*WHITE),
             foreground_color=pygame.Color(*DARK),
             padding=6, font_size=20, outline=False,
@@ -710,7 +880,8 @@ def run_single(idx: int) -> None:
         state.label.rect.bottom = HEADER_HEIGHT - 10
         state.overlay = False
 
-    maze.visualize(solution=solution, after_animation=callback)
+    maze.visualize(solution=stream, after_animation=callback)
+    state.search = (text, stream)
 
     state.label = Label(
         f"Running {text}", "center", 0,
@@ -729,10 +900,23 @@ def run_all(algo_idx: int, maze_idx: int = -1) -> None:
         algo_idx (int): Algorithm index
         maze_idx (int, optional): Maze index. Defaults to -1.
     """
+    stop_search()
     maze.clear_visited()
     text = algo_menu.children[algo_idx].text
+    stream = maze.stream(text)
 
     def callback():
+        solution = stream.solution
+        state.search = None
+
+        if text not in state.results:
+            state.results[text] = vars(solution)
+        else:
+            state.results[text]["explored_length"] += solution.explored_length
+            state.results[text]["path_length"] += solution.path_length
+            state.results[text]["path_cost"] += solution.path_cost
+            state.results[text]["time"] += solution.time
+
         if algo_idx + 1 < len(algo_menu.children):
             run_all(algo_idx + 1, maze_idx)
         elif state.run_all_mazes \
@@ -789,17 +973,8 @@ def run_all(algo_idx: int, maze_idx: int = -1) -> None:
             state.run_all_mazes = False
             state.overlay = False
 
-    solution = maze.solve(text)
-
-    if text not in state.results:
-        state.results[text] = vars(solution)
-    else:
-        state.results[text]["explored_length"] += solution.explored_length
-        state.results[text]["path_length"] += solution.path_length
-        state.results[text]["path_cost"] += solution.path_cost
-        state.results[text]["time"] += solution.time
-
-    maze.visualize(solution=solution, after_animation=callback)
+    maze.visualize(solution=stream, after_animation=callback)
+    state.search = (text, stream)
 
     state.label = Label(
         f"Running {text}", "center", 0,
@@ -811,6 +986,35 @@ def run_all(algo_idx: int, maze_idx: int = -1) -> None:
     state.label.rect.bottom = HEADER_HEIGHT - 10
 
 
+def run_parallel() -> None:
+    """Run all the algorithms on current and all generated mazes in
+    worker processes, without visualising them
+    """
+    stop_search()
+    maze.clear_visited()
+    grids = [maze.grid.to_bytes()]
+
+    # Generate every maze instantly and snapshot it
+    for button in generate_menu.children:
+        maze.clear_board()
+        maze.generate_maze(algorithm=button.text)
+        animator.finish()
+        grids.append(maze.grid.to_bytes())
+
+    texts = [button.text for button in algo_menu.children]
+    metrics = compare(grids, [ALGORITHMS[text.strip()] for text in texts])
+
+    for text in texts:
+        state.results[text] = metrics[ALGORITHMS[text.strip()]]
+
+    results = list(state.results.items())
+    results.sort(key=lambda item: item[1]["time"])
+
+    show_results(results)
+    state.need_update = True
+    state.overlay = False
+
+
 def show_results(results: list[tuple[str, dict[str, float]]]) -> None:
     """Display results
 
@@ -953,7 +1157,7 @@ def show_results(results: list[tuple[str, dict[str, float]]]) -> None:
             Table(
                 x=0,
                 y=0,
-                rows=6,
+                rows=len(results) + 1,
                 columns=5,
                 padding=20,
                 color=DARK,
@@ -1,4 +1,5 @@
-from typing import Optional
+from array import array
+from typing import Iterator, Optional
 import pygame
 
 
@@ -6,7 +7,8 @@ from .generate import GenerationCallback, MazeGenerator
 from .animations import AnimatingNode, Animation, AnimationCallback, Animator
 from .pathfinder.models.node import Node
 from .pathfinder.models.solution import Solution
-from .pathfinder.main import PathFinder
+from .pathfinder.cache import PathCache
+from .pathfinder.main import PathFinder, SearchStream
 from .pathfinder.models.grid import Grid
 from .pathfinder.models.search_types import Search
 
@@ -35,6 +37,22 @@ from .constants import (
     YELLOW
 )
 
+# Search of every algorithm name shown in the menus
+ALGORITHMS: dict[str, Search] = {
+    "A* Search": Search.ASTAR_SEARCH,
+    "Dijkstra's Search": Search.DIJKSTRAS_SEARCH,
+    "Greedy Best First Search": Search.GREEDY_BEST_FIRST_SEARCH,
+    "Breadth First Search": Search.BREADTH_FIRST_SEARCH,
+    "Depth First Search": Search.DEPTH_FIRST_SEARCH,
+    "Bidirectional BFS": Search.BIDIRECTIONAL_BFS,
+    "Bidirectional A* Search": Search.BIDIRECTIONAL_ASTAR,
+    "Jump Point Search": Search.JUMP_POINT_SEARCH,
+    "HPA* Search": Search.HPA_STAR,
+    "ALT Search": Search.ALT_SEARCH,
+    "D* Lite": Search.DSTAR_LITE,
+    "Flow Field": Search.FLOW_FIELD,
+}
+
 
 class MazeNode(Node):
     def __init__(
@@ -70,10 +88,18 @@ class Maze:
 
         self.start = (self.height // 2, start_col)
         self.goal = (self.height // 2, goal_col)
-        self.maze[self.start[0]][self.start[1]].value = "A"
-        self.maze[self.start[0]][self.start[1]].cost = 0
-        self.maze[self.goal[0]][self.goal[1]].value = "B"
-        self.maze[self.goal[0]][self.goal[1]].cost = 1
+
+        # Flat wall/cost arrays kept in sync with the nodes for PathFinder
+        self.grid = self._create_grid()
+
+        # Cells currently painted as visited or path
+        self.visited: set[tuple[int, int]] = set()
+
+        # Solutions found so far, reused until the maze changes
+        self.cache = PathCache()
+
+        self.set_cell(self.start, "A", forced=True)
+        self.set_cell(self.goal, "B", forced=True)
 
         # Generate screen coordinates for maze
         self.coords = self._generate_coordinates()
@@ -81,6 +107,23 @@ class Maze:
         # ...
         self.speed = "Fast"
 
+    def _create_grid(self) -> Grid:
+        """Create an empty array-backed grid of the maze size
+
+        Returns:
+            Grid: Grid with no walls and unit costs
+        """
+        size = self.width * self.height
+
+        return Grid(
+            walls=bytearray(size),
+            costs=array("H", [1]) * size,
+            width=self.width,
+            height=self.height,
+            start=self.start,
+            end=self.goal
+        )
+
     def _generate_coordinates(self) -> list[list[tuple[int, int]]]:
         """Generate screen coordinates for maze
 
@@ -138,6 +181,9 @@ class Maze:
             value (str): String value for the cell
             forced (bool): Force set
         """
+        if value in ("V", "*"):
+            self.visited.add(pos)
+
         if pos in (self.start, self.goal) and not forced:
             if value == "V":
                 self.maze[pos[0]][pos[1]].color = BLUE
@@ -150,12 +196,12 @@ class Maze:
                 color = WHITE
                 cost = 0
                 self.start = pos
-                self.maze[pos[0]][pos[1]].parent = None
+                self.grid.start = pos
             case "B":
                 color = WHITE
                 cost = 1
                 self.goal = pos
-                self.maze[pos[0]][pos[1]].parent = None
+                self.grid.end = pos
             case "#":
                 cost = -1
                 color = DARK
@@ -173,6 +219,11 @@ class Maze:
         self.maze[pos[0]][pos[1]].cost = cost
         self.maze[pos[0]][pos[1]].color = color
 
+        if cost < 0:
+            self.grid.set_wall(pos)
+        else:
+            self.grid.set_cost(pos, cost)
+
     def set_speed(self, speed_str: str) -> None:
         """Set visualisation speed
 
@@ -190,6 +241,8 @@ class Maze:
         self.maze = [[MazeNode("1", (rowIdx, colIdx), 1)
                       for colIdx in range(self.width)]
                      for rowIdx in range(self.height)]
+        self.grid = self._create_grid()
+        self.visited.clear()
 
         self.set_cell(self.start, "A", forced=True)
         self.set_cell(self.goal, "B", forced=True)
@@ -197,17 +250,12 @@ class Maze:
     def clear_visited(self) -> None:
         """Clear visited nodes
         """
-        for rowIdx in range(self.height):
-            for colIdx in range(self.width):
-                node = self.maze[rowIdx][colIdx]
-                self.maze[rowIdx][colIdx] = MazeNode(
-                    str(node.cost) if node.value in ("V", "*") else node.value,
-                    (rowIdx, colIdx),
-                    node.cost
-                )
+        for pos in self.visited:
+            node = self.maze[pos[0]][pos[1]]
+            if node.value in ("V", "*"):
+                self.set_cell(pos, str(node.cost))
 
-                self.set_cell((rowIdx, colIdx),
-                              self.maze[rowIdx][colIdx].value)
+        self.visited.clear()
 
         self.set_cell(self.start, "A", forced=True)
         self.set_cell(self.goal, "B", forced=True)
@@ -280,141 +328,42 @@ class Maze:
             algorithm (str): Algorithm name
         """
 
-        match algorithm:
-            case "Recursive Division":
-                self._draw_walls_around()
-                self.generator.recursive_division(
-                    1, self.width - 2, 1, self.height - 2)
-            case "Randomised DFS":
-                self.generator.randomised_dfs()
-            case "Prim's Algorithm":
-                self.generator.randomised_prims_algorithm()
-            case "Basic Weight Maze":
-                self.generator.basic_weight_maze()
-            case "Basic Random Maze":
-                self.generator.basic_random_maze()
+        self.generator.generate(algorithm)
 
         list(self.animator.nodes_to_animate.values()
              )[-1][-1].after_animation = after_generation
 
-    def _draw_walls_around(self) -> None:
-        """Draw walls around the maze
-        """
-
-        # Top Horizontal
-        nodes_to_animate = []
-        for i in range(self.width):
-            x, y = self.coords[0][i]
-            nodes_to_animate.append(
-                AnimatingNode(
-                    rect=pygame.Rect(0, 0, MIN_SIZE, MIN_SIZE),
-                    center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2),
-                    value="#",
-                    ticks=pygame.time.get_ticks(),
-                    color=DARK
-                )
-            )
-
-        self.animator.add_nodes_to_animate(nodes_to_animate)
-
-        # Bottom horizontal
-        nodes_to_animate = []
-        for i in range(self.width):
-            x, y = self.coords[-1][i]
-            nodes_to_animate.append(
-                AnimatingNode(
-                    rect=pygame.Rect(0, 0, MIN_SIZE, MIN_SIZE),
-                    center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2),
-                    value="#",
-                    ticks=pygame.time.get_ticks(),
-                    color=DARK
-                )
-            )
-
-        self.animator.add_nodes_to_animate(nodes_to_animate)
-
-        # Sides
-        nodes_to_animate = []
-        for i in range(self.height):
-            x, y = self.coords[i][0]
-            nodes_to_animate.append(
-                AnimatingNode(
-                    rect=pygame.Rect(0, 0, MIN_SIZE, MIN_SIZE),
-                    center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2),
-                    value="#",
-                    ticks=pygame.time.get_ticks(),
-                    color=DARK
-                )
-            )
-
-            x, y = self.coords[i][-1]
-            nodes_to_animate.append(
-                AnimatingNode(
-                    rect=pygame.Rect(0, 0, MIN_SIZE, MIN_SIZE),
-                    center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2),
-                    value="#",
-                    ticks=pygame.time.get_ticks(),
-                    color=DARK
-                )
-            )
-
-        self.animator.add_nodes_to_animate(nodes_to_animate)
-
-    def solve(self, algo_name: str,) -> Solution:
-        """Solve the maze with an algorithm
+    def stream(self, algo_name: str) -> SearchStream:
+        """Start solving the maze with an algorithm, one explored cell at
+        a time
 
         Args:
             algo_name (str): Name of algorithm
+
+        Returns:
+            SearchStream: Explored cells, then the solution
         """
-        # String -> Search Algorithm
-        mapper: dict[str, Search] = {
-            "A* Search": Search.ASTAR_SEARCH,
-            "Dijkstra's Search": Search.DIJKSTRAS_SEARCH,
-            "Greedy Best First Search": Search.GREEDY_BEST_FIRST_SEARCH,
-            "Breadth First Search": Search.BREADTH_FIRST_SEARCH,
-            "Depth First Search": Search.DEPTH_FIRST_SEARCH,
-        }
-
-        # Instantiate Grid for PathFinder
-        grid = Grid(self.maze, self.start, self.goal)  # type: ignore
-
-        # Solve the maze
-        solution = PathFinder.find_path(
-            grid=grid,
-            search=mapper[algo_name.strip()],
+        return PathFinder.stream_path(
+            grid=self.grid,
+            search=ALGORITHMS[algo_name.strip()],
+            compact=True,
+            cache=self.cache
         )
 
-        return solution
-
     def visualize(
         self,
-        solution: Solution,
+        solution: Solution | SearchStream,
         after_animation: Optional[AnimationCallback] = None,
     ) -> None:
         """Visualize solution
 
+        A SearchStream is animated while the search is still running and
+        only the cells being animated are kept.
+
         Args:
-            solution (Solution): Solution object
+            solution (Solution | SearchStream): Solution object or stream
             after_animation (Optional[AnimationCallback], optional): Called after animation. Defaults to None.
         """
-
-        # Animate solution nodes
-        nodes = []
-        for cell in solution.explored:
-            x, y = self.coords[cell[0]][cell[1]]
-            nodes.append(
-                AnimatingNode(
-                    center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2),
-                    rect=pygame.Rect(0, 0, CELL_SIZE, CELL_SIZE),
-                    ticks=pygame.time.get_ticks(),
-                    value="V",
-                    color=WHITE,
-                    colors=[YELLOW, DARK_BLUE_2, BLUE_2, GREEN_2, BLUE],
-                    duration=1500,
-                    animation=Animation.PATH_ANIMATION
-                )
-            )
-
         match self.speed:
             case "Fast":
                 gap = 5
@@ -425,10 +374,58 @@ class Maze:
             case _:
                 gap = 5
 
-        self.animator.add_nodes_to_animate(nodes, gap=gap)
+        self.animator.add_nodes_to_animate(
+            self._explored_nodes(solution, gap, after_animation),
+            gap=gap
+        )
+
+    def _explored_nodes(
+        self,
+        solution: Solution | SearchStream,
+        gap: int,
+        after_animation: Optional[AnimationCallback] = None,
+    ) -> Iterator[AnimatingNode]:
+        """Create a node per explored cell as the animation needs it, then
+        add the path nodes
+
+        Args:
+            solution (Solution | SearchStream): Solution object or stream
+            gap (int): Gap between explored nodes
+            after_animation (Optional[AnimationCallback], optional): Called after animation. Defaults to None.
+
+        Yields:
+            AnimatingNode: Explored node
+        """
+
+        # Animate solution nodes
+        cells = solution if isinstance(solution, SearchStream) \
+            else solution.explored
+
+        node = None
+        for cell in cells:
+            x, y = self.coords[cell[0]][cell[1]]
+            node = AnimatingNode(
+                center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2),
+                rect=pygame.Rect(0, 0, CELL_SIZE, CELL_SIZE),
+                ticks=pygame.time.get_ticks(),
+                value="V",
+                color=WHITE,
+                colors=[YELLOW, DARK_BLUE_2, BLUE_2, GREEN_2, BLUE],
+                duration=1500,
+                animation=Animation.PATH_ANIMATION
+            )
+            yield node
+
+        if isinstance(solution, SearchStream):
+            solution = solution.solution
 
         if not solution.path:
-            nodes[-1].after_animation = after_animation
+            # The last node is done already if the search ended slowly
+            if node is not None and node in \
+                    self.animator.nodes_to_animate.get(node.center, []):
+                node.after_animation = after_animation
+            elif after_animation:
+                after_animation()
             return
 
         # Color the shortest path in yellowd
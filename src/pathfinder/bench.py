@@ -0,0 +1,276 @@
+"""Time searches on random or saved grids without opening a window
+
+Usage: python -m src.pathfinder.bench [--size 200x200] [--density 0.2]
+       [--weights 0.2] [--search A* --search DS ...] [--json]
+"""
+import argparse
+import json
+import random
+import statistics
+from array import array
+
+from .main import PathFinder
+from .models.grid import Grid
+from .models.search_types import Search
+
+# Heaviest weight put on random cells (weights in the app go up to 51)
+MAX_WEIGHT = 9
+
+
+def random_grid(
+    width: int,
+    height: int,
+    density: float,
+    weights: float,
+    seed: int
+) -> Grid:
+    """Generate a grid with random walls and weights, from the top-left
+    corner to the bottom-right one
+
+    Args:
+        width (int): Number of columns
+        height (int): Number of rows
+        density (float): Share of cells that are walls
+        weights (float): Share of open cells that are weighted
+        seed (int): Seed of the random generator
+
+    Returns:
+        Grid: Generated grid
+    """
+    rng = random.Random(seed)
+    size = width * height
+
+    walls = bytearray(rng.random() < density for _ in range(size))
+    costs = array("H", [1]) * size
+
+    for idx in range(size):
+        if walls[idx]:
+            costs[idx] = 0
+        elif rng.random() < weights:
+            costs[idx] = rng.randint(2, MAX_WEIGHT)
+
+    # Endpoints and the cells next to them are open so that they are not
+    # walled in; the start weighs nothing like in the app
+    start, end = 0, size - 1
+    for idx in (start, start + 1, start + width, end, end - 1, end - width):
+        if 0 <= idx < size and walls[idx]:
+            walls[idx] = 0
+            costs[idx] = 1
+
+    costs[start], costs[end] = 0, 1
+
+    return Grid(walls, costs, width, height, (0, 0), (height - 1, width - 1))
+
+
+def run(
+    grids: list[bytes],
+    search: Search,
+    warmup: int,
+    repeat: int,
+    warm: bool = False
+) -> dict[str, float | int | str | None]:
+    """Time one search on every grid
+
+    Args:
+        grids (list[bytes]): Serialised grids
+        search (Search): Search to time
+        warmup (int): Untimed runs per grid
+        repeat (int): Timed runs per grid
+        warm (bool, optional): Reuse one grid for every run so cached
+        preprocessing is only paid once. Defaults to False.
+
+    Returns:
+        dict[str, float | int | str | None]: Median and 95th percentile
+        time in milliseconds, expansions and path cost per grid (None
+        when no path was found) and the number of grids solved
+    """
+    times = []
+    expansions = []
+    costs = []
+    found = 0
+
+    for data in grids:
+        grid = Grid.from_bytes(data)
+
+        for i in range(warmup + repeat):
+            if not warm:
+                grid = Grid.from_bytes(data)
+
+            solution = PathFinder.find_path(grid, search)
+            if i >= warmup:
+                times.append(solution.time)
+
+        expansions.append(solution.explored_length)
+        if solution.path:
+            costs.append(solution.path_cost)
+            found += 1
+
+    return {
+        "search": search.value,
+        "median_ms": statistics.median(times),
+        "p95_ms": percentile(times, 95),
+        "expansions": statistics.mean(expansions),
+        "path_cost": statistics.mean(costs) if costs else None,
+        "solved": found,
+    }
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Get a percentile of some samples by linear interpolation
+
+    Args:
+        samples (list[float]): Samples
+        q (float): Percentile between 0 and 100
+
+    Returns:
+        float: Percentile value
+    """
+    samples = sorted(samples)
+    rank = (len(samples) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(samples) - 1)
+
+    return samples[low] + (samples[high] - samples[low]) * (rank - low)
+
+
+def format_table(rows: list[dict[str, float | int | str | None]]) -> str:
+    """Format benchmark results as a plain text table
+
+    Args:
+        rows (list[dict[str, float | int | str | None]]): Results
+
+    Returns:
+        str: Table with one line per search
+    """
+    header = ("Search", "Median ms", "p95 ms", "Expansions", "Cost",
+              "Solved")
+    lines = [header]
+
+    for row in rows:
+        cost = row["path_cost"]
+        lines.append((
+            str(row["search"]),
+            f"{row['median_ms']:.3f}",
+            f"{row['p95_ms']:.3f}",
+            f"{row['expansions']:.0f}",
+            "-" if cost is None else f"{cost:.0f}",
+            str(row["solved"]),
+        ))
+
+    widths = [max(len(line[i]) for line in lines)
+              for i in range(len(header))]
+
+    return "\n".join(
+        "  ".join(cell.ljust(width) if i == 0 else cell.rjust(width)
+                  for i, (cell, width) in enumerate(zip(line, widths)))
+        for line in lines
+    )
+
+
+def parse_size(text: str) -> tuple[int, int]:
+    """Parse a grid size like 200x100 (or 200 for a square)
+
+    Args:
+        text (str): Size text
+
+    Returns:
+        tuple[int, int]: Width and height
+    """
+    try:
+        width, _, height = text.lower().partition("x")
+        size = int(width), int(height or width)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
+
+    if min(size) < 1:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
+
+    return size
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse the command line and run the benchmark
+
+    Args:
+        argv (list[str] | None, optional): Arguments. Defaults to
+        sys.argv[1:].
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.pathfinder.bench",
+        description="Time pathfinding searches on random or saved grids."
+    )
+    parser.add_argument("--size", type=parse_size, default=(100, 100),
+                        help="grid size as WIDTHxHEIGHT (default 100x100)")
+    parser.add_argument("--density", type=float, default=0.2,
+                        help="share of cells that are walls (default 0.2)")
+    parser.add_argument("--weights", type=float, default=0.0,
+                        help="share of open cells with a random weight "
+                        f"from 2 to {MAX_WEIGHT} (default 0)")
+    parser.add_argument("--grids", type=int, default=1,
+                        help="number of random grids (default 1)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the first random grid (default 0)")
+    parser.add_argument("--load", action="append", default=[],
+                        metavar="FILE",
+                        help="benchmark a grid saved with Grid.to_bytes "
+                        "instead of random ones (repeatable)")
+    parser.add_argument("--save", metavar="FILE",
+                        help="save the first grid with Grid.to_bytes")
+    parser.add_argument("--search", action="append", metavar="NAME",
+                        choices=[search.value for search in Search],
+                        help="search to run (repeatable, default all): "
+                        + ", ".join(search.value for search in Search))
+    parser.add_argument("--warmup", type=int, default=1,
+                        help="untimed runs per grid (default 1)")
+    parser.add_argument("--repeat", type=int, default=10,
+                        help="timed runs per grid (default 10)")
+    parser.add_argument("--warm", action="store_true",
+                        help="reuse one grid per search so cached "
+                        "preprocessing is not timed again")
+    parser.add_argument("--json", action="store_true",
+                        help="print the results as JSON")
+
+    args = parser.parse_args(argv)
+    if args.repeat < 1 or args.warmup < 0:
+        parser.error("--repeat must be positive and --warmup not negative")
+
+    if args.load:
+        grids = []
+        for path in args.load:
+            with open(path, "rb") as file:
+                grids.append(file.read())
+    else:
+        width, height = args.size
+        grids = [
+            random_grid(width, height, args.density, args.weights,
+                        args.seed + i).to_bytes()
+            for i in range(args.grids)
+        ]
+
+    if args.save:
+        with open(args.save, "wb") as file:
+            file.write(grids[0])
+
+    if args.search:
+        searches = [Search(value) for value in args.search]
+    else:
+        searches = list(Search)
+
+    rows = []
+    for search in searches:
+        try:
+            rows.append(run(grids, search, args.warmup, args.repeat,
+                            args.warm))
+        except ImportError as error:
+            # Optional dependency of this search is missing
+            if args.search:
+                parser.error(str(error))
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(format_table(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Reuse the solutions of searches already run on identical grids"""
+import copy
+from collections import OrderedDict
+
+from .models.grid import Grid
+from .models.search_types import Search
+from .models.solution import Solution
+
+# Grid fingerprint, start, end, search and whether the solution is compact
+CacheKey = tuple[int, tuple[int, int], tuple[int, int], Search, bool]
+
+
+class PathCache:
+    """Model a least recently used cache of solutions
+
+    Solutions are keyed by the fingerprint of the grid's cells, its start
+    and end and the search. Any edit or moved endpoint therefore misses,
+    and undoing it hits again; entries of grids that changed are never
+    looked up again and age out. Memory is bounded by the number of
+    entries and the number of explored and path cells they hold.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 64,
+        max_cells: int = 1_000_000
+    ) -> None:
+        """Create an empty cache
+
+        Args:
+            capacity (int, optional): Most solutions kept. Defaults to
+            64.
+            max_cells (int, optional): Most explored and path cells kept
+            across all solutions. Defaults to 1_000_000.
+        """
+        self.capacity = capacity
+        self.max_cells = max_cells
+
+        # Least recently used first
+        self.entries: OrderedDict[CacheKey, Solution] = OrderedDict()
+        self.cells = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(grid: Grid, search: Search, compact: bool = False) -> CacheKey:
+        """Get the key of a query
+
+        Args:
+            grid (Grid): Grid of points
+            search (Search): Search to use
+            compact (bool, optional): Whether the solution is a
+            CompactSolution. Defaults to False.
+
+        Returns:
+            CacheKey: Cache key
+        """
+        return grid.fingerprint(), grid.start, grid.end, search, compact
+
+    @staticmethod
+    def size(solution: Solution) -> int:
+        """Get the number of cells a solution holds
+
+        Args:
+            solution (Solution): Solution
+
+        Returns:
+            int: Explored and path cells
+        """
+        return solution.explored_length + solution.path_length
+
+    def get(self, key: CacheKey) -> Solution | None:
+        """Look up a solution and mark it as recently used
+
+        Args:
+            key (CacheKey): Cache key
+
+        Returns:
+            Solution | None: Copy of the cached solution (sharing its
+            path and explored cells, which must not be changed), None on
+            a miss
+        """
+        solution = self.entries.get(key)
+
+        if solution is None:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+
+        return copy.copy(solution)
+
+    def put(self, key: CacheKey, solution: Solution) -> None:
+        """Cache a solution, evicting the least recently used ones over
+        the limits
+
+        Args:
+            key (CacheKey): Cache key
+            solution (Solution): Solution, copied so that later changes
+            by the caller do not reach the cache
+        """
+        size = PathCache.size(solution)
+        if size > self.max_cells:
+            return
+
+        if key in self.entries:
+            self.cells -= PathCache.size(self.entries.pop(key))
+
+        self.entries[key] = copy.copy(solution)
+        self.cells += size
+
+        while len(self.entries) > self.capacity \
+                or self.cells > self.max_cells:
+            _, evicted = self.entries.popitem(last=False)
+            self.cells -= PathCache.size(evicted)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached solution, keeping the counters
+        """
+        self.entries.clear()
+        self.cells = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return (f"PathCache({len(self.entries)} solutions, "
+                f"{self.hits} hits, {self.misses} misses, "
+                f"{self.evictions} evictions)")
@@ -1,4 +1,5 @@
 import time
+from array import array
 from typing import Callable
 
 from .search.astar import AStarSearch
@@ -6,10 +7,21 @@ from .search.gbfs import GreedyBestFirstSearch
 from .search.bfs import BreadthFirstSearch
 from .search.dfs import DepthFirstSearch
 from .search.dijkstras import DijkstrasSearch
-from .models.grid import Grid
-from .models.solution import Solution
+from .search.bidirectional_bfs import BidirectionalBreadthFirstSearch
+from .search.bidirectional_astar import BidirectionalAStarSearch
+from .search.jps import JumpPointSearch
+from .search.hpastar import HPAStarSearch
+from .search.alt import ALTSearch
+from .search.arastar import ARAStarSearch
+from .search.dstar_lite import DStarLiteSearch
+from .search.flow_field import DistanceField, FlowFieldSearch
+from .search.vectorised_bfs import VectorisedBreadthFirstSearch
+from .cache import CacheKey, PathCache
+from .models.grid import INFINITY, Grid
+from .models.solution import CompactSolution, NoSolution, Solution
 from .models.search_types import Search
 from .models.search_types import Search
+from .models.stream import SolutionStream
 
 SearchFunction = Callable[[Grid], Solution]
 
@@ -19,18 +31,477 @@ SEARCH: dict[Search, SearchFunction] = {
     Search.BREADTH_FIRST_SEARCH: BreadthFirstSearch.search,
     Search.GREEDY_BEST_FIRST_SEARCH: GreedyBestFirstSearch.search,
     Search.DEPTH_FIRST_SEARCH: DepthFirstSearch.search,
+    Search.BIDIRECTIONAL_BFS: BidirectionalBreadthFirstSearch.search,
+    Search.BIDIRECTIONAL_ASTAR: BidirectionalAStarSearch.search,
+    Search.JUMP_POINT_SEARCH: JumpPointSearch.search,
+    Search.HPA_STAR: HPAStarSearch.search,
+    Search.ALT_SEARCH: ALTSearch.search,
+    Search.DSTAR_LITE: DStarLiteSearch.search,
+    Search.FLOW_FIELD: FlowFieldSearch.search,
+    Search.VECTORISED_BFS: VectorisedBreadthFirstSearch.search,
+    Search.ARA_STAR: ARAStarSearch.search,
 }
 
+# Searches that take several starts and ends (`starts=`, `ends=`)
+MULTI_GOAL_SEARCH: dict[Search, Callable[..., Solution]] = {
+    Search.ASTAR_SEARCH: AStarSearch.search,
+    Search.DIJKSTRAS_SEARCH: DijkstrasSearch.search,
+    Search.GREEDY_BEST_FIRST_SEARCH: GreedyBestFirstSearch.search,
+}
+
+
+# Searches that can run one expansion at a time
+STREAM: dict[Search, Callable[[Grid], SolutionStream]] = {
+    Search.ASTAR_SEARCH: AStarSearch.stream,
+    Search.DIJKSTRAS_SEARCH: DijkstrasSearch.stream,
+    Search.BREADTH_FIRST_SEARCH: BreadthFirstSearch.stream,
+    Search.GREEDY_BEST_FIRST_SEARCH: GreedyBestFirstSearch.stream,
+    Search.DEPTH_FIRST_SEARCH: DepthFirstSearch.stream,
+}
+
+
+class SearchStream:
+    """Iterate over the cells a search explores while it runs
+
+    Every step runs the search up to its next expansion, so a consumer
+    can start using the first cells straight away. Searches without a
+    stream run to completion on the first step and their cells are
+    replayed. `solution` is None until the iterator is exhausted; its
+    `time` only counts the time spent searching.
+    """
+
+    def __init__(
+        self,
+        grid: Grid,
+        search: Search,
+        compact: bool = False,
+        cache: PathCache | None = None
+    ) -> None:
+        self.grid = grid
+        self.compact = compact
+        self.solution: Solution | None = None
+
+        # Seconds spent inside the search so far
+        self.elapsed = 0.0
+
+        # Number of cells explored so far
+        self.explored = 0
+
+        # Cached solution being replayed, or where to cache the new one
+        self.cache = cache
+        self.key: CacheKey | None = None
+        self.hit: Solution | None = None
+
+        if cache is not None:
+            self.key = PathCache.key(grid, search, compact)
+            self.hit = cache.get(self.key)
+
+        if self.hit is not None:
+            self.cells = SearchStream.recall(grid, self.hit)
+        elif search in STREAM:
+            self.cells = STREAM[search](grid)
+        else:
+            self.cells = SearchStream.replay(grid, search)
+
+    @staticmethod
+    def replay(grid: Grid, search: Search) -> SolutionStream:
+        """Run a search to completion, then yield its explored cells
+
+        Args:
+            grid (Grid): Grid of points
+            search (Search): Search to run
+
+        Yields:
+            int: Index of every explored cell, in order
+
+        Returns:
+            Solution: Solution found
+        """
+        return (yield from SearchStream.recall(grid, SEARCH[search](grid)))
+
+    @staticmethod
+    def recall(grid: Grid, solution: Solution) -> SolutionStream:
+        """Yield the explored cells of a solution found earlier
+
+        Args:
+            grid (Grid): Grid of points
+            solution (Solution): Solution found
+
+        Yields:
+            int: Index of every explored cell, in order
+
+        Returns:
+            Solution: The same solution
+        """
+        for row, col in solution.explored:
+            yield row * grid.width + col
+
+        return solution
+
+    def __iter__(self) -> "SearchStream":
+        return self
+
+    def __next__(self) -> tuple[int, int]:
+        start_time = time.perf_counter()
+
+        try:
+            idx = next(self.cells)
+        except StopIteration as stop:
+            self.elapsed += time.perf_counter() - start_time
+
+            # Cached solutions keep the time of the search that found them
+            if self.hit is not None:
+                self.solution = self.hit
+                raise StopIteration
+
+            solution = stop.value
+            solution.time = self.elapsed * 1000
+            if self.compact:
+                solution = CompactSolution.from_solution(
+                    solution, self.grid.width
+                )
+
+            if self.cache is not None:
+                self.cache.put(self.key, solution)
+
+            self.solution = solution
+            raise StopIteration
+
+        self.elapsed += time.perf_counter() - start_time
+        self.explored += 1
+
+        return divmod(idx, self.grid.width)
+
 
 class PathFinder:
     @staticmethod
     def find_path(
         grid: Grid,
         search: Search,
+        compact: bool = False,
+        cache: PathCache | None = None
     ) -> Solution:
+        """Find a path between the start and end of a grid
+
+        Args:
+            grid (Grid): Grid of points
+            search (Search): Search to use
+            compact (bool, optional): Return a CompactSolution, which
+            keeps the path and explored cells in flat arrays. Defaults
+            to False.
+            cache (PathCache | None, optional): Return the solution found
+            earlier for the same cells, endpoints and search, if any,
+            and cache new ones. Defaults to None.
+
+        Returns:
+            Solution: Solution found
+        """
+        if cache is not None:
+            key = PathCache.key(grid, search, compact)
+            solution = cache.get(key)
+            if solution is not None:
+                return solution
+
         start_time = time.perf_counter()
         solution = SEARCH[search](grid)
         time_taken = (time.perf_counter() - start_time) * 1000
         solution.time = time_taken
 
+        # Encoded after timing, like the position lists it replaces
+        if compact:
+            solution = CompactSolution.from_solution(solution, grid.width)
+
+        if cache is not None:
+            cache.put(key, solution)
+
         return solution
+
+    @staticmethod
+    def find_path_within(grid: Grid, deadline: float) -> Solution:
+        """Find the best path ARA* can find within a time budget
+
+        The search picks up where the previous call on the same grid
+        stopped, so calling again while nothing changed keeps improving
+        the path until its `bound` is 1 (the cheapest path).
+
+        Args:
+            grid (Grid): Grid of points
+            deadline (float): Milliseconds to spend improving the path,
+            the first path is found however long it takes
+
+        Returns:
+            Solution: Best solution found so far, its `bound` says how
+            many times the cheapest path cost it may be
+        """
+        start_time = time.perf_counter()
+        solution = ARAStarSearch.search(grid, deadline)
+        solution.time = (time.perf_counter() - start_time) * 1000
+
+        return solution
+
+    @staticmethod
+    def stream_path(
+        grid: Grid,
+        search: Search,
+        compact: bool = False,
+        cache: PathCache | None = None
+    ) -> SearchStream:
+        """Find a path between the start and end of a grid, one explored
+        cell at a time
+
+        The grid must not change until the stream is exhausted.
+
+        Args:
+            grid (Grid): Grid of points
+            search (Search): Search to use
+            compact (bool, optional): Make the final solution a
+            CompactSolution. Defaults to False.
+            cache (PathCache | None, optional): Replay the solution found
+            earlier for the same cells, endpoints and search, if any,
+            and cache new ones. Defaults to None.
+
+        Returns:
+            SearchStream: Explored cells, then `solution` is set
+        """
+        return SearchStream(grid, search, compact, cache)
+
+    @staticmethod
+    def find_nearest(
+        grid: Grid,
+        ends: list[tuple[int, int]],
+        search: Search = Search.ASTAR_SEARCH,
+        starts: list[tuple[int, int]] | None = None
+    ) -> Solution:
+        """Find the cheapest path from any of several starts to the
+        nearest of several ends with a single search
+
+        Args:
+            grid (Grid): Grid of points
+            ends (list[tuple[int, int]]): Target cells
+            search (Search, optional): One of MULTI_GOAL_SEARCH.
+            Defaults to Search.ASTAR_SEARCH.
+            starts (list[tuple[int, int]] | None, optional): Source
+            cells. Defaults to the grid's start.
+
+        Returns:
+            Solution: Solution found, the target reached is the last cell
+        """
+        start_time = time.perf_counter()
+        solution = MULTI_GOAL_SEARCH[search](grid, starts=starts, ends=ends)
+        solution.time = (time.perf_counter() - start_time) * 1000
+
+        return solution
+
+    @staticmethod
+    def find_all(
+        grid: Grid,
+        ends: list[tuple[int, int]],
+        search: Search = Search.ASTAR_SEARCH
+    ) -> Solution:
+        """Find a path from the start that visits every target
+
+        Targets are visited nearest first: each leg is one search from
+        the last target reached to the nearest remaining one. Every leg
+        is as cheap as the search allows, but the visiting order is
+        greedy, not the cheapest possible tour.
+
+        Args:
+            grid (Grid): Grid of points
+            ends (list[tuple[int, int]]): Target cells
+            search (Search, optional): One of MULTI_GOAL_SEARCH.
+            Defaults to Search.ASTAR_SEARCH.
+
+        Returns:
+            Solution: Solution found, empty if any target is unreachable
+        """
+        start_time = time.perf_counter()
+
+        remaining = list(dict.fromkeys(ends))
+        cells = [grid.start]
+        explored: dict[tuple[int, int], None] = {}
+        path_cost = 0
+
+        while remaining:
+            leg = MULTI_GOAL_SEARCH[search](
+                grid, starts=[cells[-1]], ends=remaining
+            )
+            explored.update(dict.fromkeys(leg.explored))
+
+            # Return empty Solution object for no solution
+            if not leg.path:
+                solution = NoSolution([], list(explored))
+                break
+
+            cells.extend(leg.path[1:])
+            path_cost += leg.path_cost
+            remaining.remove(cells[-1])
+        else:
+            solution = Solution(cells, list(explored), path_cost=path_cost)
+
+        solution.time = (time.perf_counter() - start_time) * 1000
+
+        return solution
+
+    @staticmethod
+    def distance_field(grid: Grid) -> DistanceField:
+        """Get the cost of reaching the end from every cell
+
+        The field is cached per grid and only recomputed after the end
+        moves or an edit changes it. `field.distance` is a flat array
+        indexed like the grid and `field.path(idx)` extracts the path
+        from any cell without searching.
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            DistanceField: Distance field rooted at the end
+        """
+        return FlowFieldSearch.field(grid)
+
+    @staticmethod
+    def find_paths(
+        grid: Grid,
+        pairs: list[tuple[tuple[int, int], tuple[int, int]]],
+        paths: bool = False
+    ) -> tuple[array, list[list[tuple[int, int]]] | None]:
+        """Answer many start/end queries on one grid
+
+        Queries sharing a start are answered from one Dijkstra sweep
+        from that start; of the rest, queries sharing an end from one
+        sweep towards that end. The remaining queries run A* Search,
+        guided by landmarks (built once for the grid) when there are
+        enough of them to pay for it. The grid's own start and end are
+        left untouched.
+
+        Every cell weighs at least 1 here: the start marker's weight of 0
+        only holds for the query that starts on it.
+
+        Args:
+            grid (Grid): Grid of points
+            pairs (list[tuple[tuple[int, int], tuple[int, int]]]): Start
+            and end position of every query
+            paths (bool, optional): Also return the paths. Defaults to
+            False.
+
+        Returns:
+            tuple[array, list[list[tuple[int, int]]] | None]: Cost of
+            every query (INFINITY where there is no path) and, if
+            requested, every path (empty where there is none)
+        """
+        weights = array("H", (max(cost, 1) for cost in grid.costs))
+        costs = array("I", [INFINITY]) * len(pairs)
+        found: list[list[tuple[int, int]]] | None = \
+            [[] for _ in pairs] if paths else None
+
+        # Query numbers by start, then the leftovers by end
+        by_start: dict[int, list[int]] = {}
+        by_end: dict[int, list[int]] = {}
+        single: list[int] = []
+
+        for i, (start, end) in enumerate(pairs):
+            by_start.setdefault(grid.index(start), []).append(i)
+
+        for start, queries in by_start.items():
+            if len(queries) == 1:
+                end = grid.index(pairs[queries[0]][1])
+                by_end.setdefault(end, []).append(queries[0])
+                continue
+
+            distance = DijkstrasSearch.distances(grid, start, costs=weights)
+            for i in queries:
+                end = grid.index(pairs[i][1])
+                costs[i] = distance[end]
+
+                if found is not None and distance[end] != INFINITY:
+                    found[i] = PathFinder._trace(
+                        grid, weights, distance, end, start
+                    )
+
+        for end, queries in by_end.items():
+            if len(queries) == 1:
+                single.extend(queries)
+                continue
+
+            distance = DijkstrasSearch.distances(
+                grid, end, reverse=True, costs=weights
+            )
+            for i in queries:
+                start = grid.index(pairs[i][0])
+                costs[i] = distance[start]
+
+                if found is not None and distance[start] != INFINITY:
+                    found[i] = PathFinder._trace(
+                        grid, weights, distance, start, end, reverse=True
+                    )
+
+        if not single:
+            return costs, found
+
+        # Landmarks cost a few sweeps, worth it for enough queries
+        table = ALTSearch.table(grid) \
+            if len(single) > 2 * ALTSearch.LANDMARKS else None
+
+        for i in single:
+            start, end = pairs[i]
+            solution = AStarSearch.search(
+                grid,
+                table.heuristic(grid, end) if table else None,
+                weights,
+                starts=[start],
+                ends=[end]
+            )
+
+            if solution.path:
+                costs[i] = sum(weights[grid.index(cell)]
+                               for cell in solution.path[1:])
+                if found is not None:
+                    found[i] = solution.path
+
+        return costs, found
+
+    @staticmethod
+    def _trace(
+        grid: Grid,
+        weights: array,
+        distance: array,
+        idx: int,
+        source: int,
+        reverse: bool = False
+    ) -> list[tuple[int, int]]:
+        """Rebuild a path from the costs of a Dijkstra sweep
+
+        Args:
+            grid (Grid): Grid of points
+            weights (array): Cell weights used by the sweep
+            distance (array): Costs found by the sweep
+            idx (int): Index of the cell to trace from
+            source (int): Index of the cell the sweep started at
+            reverse (bool, optional): Whether the sweep found costs of
+            reaching the source. Defaults to False.
+
+        Returns:
+            list[tuple[int, int]]: Path from start to end
+        """
+        offsets, targets, _ = grid.adjacency()
+        cells = [idx]
+
+        while idx != source:
+            for k in range(offsets[idx], offsets[idx + 1]):
+                state = targets[k]
+
+                # Backwards along the sweep pays for the current cell,
+                # forwards (downhill) for the next one
+                step = weights[state] if reverse else weights[idx]
+
+                if distance[state] != INFINITY \
+                        and distance[state] + step == distance[idx]:
+                    idx = state
+                    break
+
+            cells.append(idx)
+
+        if not reverse:
+            cells.reverse()
+
+        return [grid.position(idx) for idx in cells]
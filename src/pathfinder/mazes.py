@@ -0,0 +1,364 @@
+"""Maze generation algorithms, independent of how the maze is drawn
+
+Every algorithm returns the cell changes it makes, in order, so the GUI
+can animate them and headless code can apply them straight to a Grid.
+"""
+import random
+
+from .models.grid import Grid
+
+# Cell changes in the order they are made: position and new cell value
+# ("#" for a wall, a digit for an open cell of that weight)
+Changes = list[tuple[tuple[int, int], str]]
+
+# Names of the maze generation algorithms
+GENERATORS = (
+    "Recursive Division",
+    "Randomised DFS",
+    "Prim's Algorithm",
+    "Basic Weight Maze",
+    "Basic Random Maze",
+)
+
+# Algorithms that carve passages out of a maze filled with walls
+CARVING = ("Randomised DFS", "Prim's Algorithm")
+
+
+def generate(
+    algorithm: str,
+    width: int,
+    height: int,
+    start: tuple[int, int],
+    goal: tuple[int, int],
+    rng: random.Random | None = None
+) -> Changes:
+    """Generate a maze with an algorithm
+
+    Carving algorithms (see CARVING) expect every cell to be a wall
+    before their changes are applied.
+
+    Args:
+        algorithm (str): One of GENERATORS
+        width (int): Number of columns
+        height (int): Number of rows
+        start (tuple[int, int]): Start position
+        goal (tuple[int, int]): Goal position
+        rng (random.Random | None, optional): Random generator. Defaults
+        to a new unseeded one.
+
+    Raises:
+        ValueError: Unknown algorithm
+
+    Returns:
+        Changes: Cell changes in order
+    """
+    rng = rng or random.Random()
+
+    match algorithm:
+        case "Recursive Division":
+            changes = _walls_around(width, height)
+            _recursive_division(changes, rng, 1, width - 2, 1, height - 2)
+            return changes
+        case "Randomised DFS":
+            return _randomised_dfs(width, height, start, rng)
+        case "Prim's Algorithm":
+            return _randomised_prims(width, height, start, goal, rng)
+        case "Basic Weight Maze":
+            return _scatter(width, height, "9", rng)
+        case "Basic Random Maze":
+            return _scatter(width, height, "#", rng)
+
+    raise ValueError(f"Unknown maze generation algorithm: {algorithm}")
+
+
+def build(
+    grid: Grid,
+    algorithm: str,
+    rng: random.Random | None = None
+) -> None:
+    """Generate a maze straight into a grid, keeping its start and end
+    open
+
+    Args:
+        grid (Grid): Grid of points
+        algorithm (str): One of GENERATORS
+        rng (random.Random | None, optional): Random generator. Defaults
+        to a new unseeded one.
+    """
+    changes = generate(
+        algorithm, grid.width, grid.height, grid.start, grid.end, rng
+    )
+
+    if algorithm in CARVING:
+        changes = [((row, col), "#")
+                   for row in range(grid.height)
+                   for col in range(grid.width)] + changes
+
+    for pos, value in changes:
+        if pos in (grid.start, grid.end):
+            continue
+
+        if value == "#":
+            grid.set_wall(pos)
+        else:
+            grid.set_cost(pos, int(value))
+
+
+def _two_step_neighbours(
+    width: int,
+    height: int,
+    cell: tuple[int, int]
+) -> list[tuple[int, int]]:
+    """Get the cells two steps away from a cell
+
+    Args:
+        width (int): Number of columns
+        height (int): Number of rows
+        cell (tuple[int, int]): Cell position
+
+    Returns:
+        list[tuple[int, int]]: Neighbours within the maze
+    """
+    neighbours = [(cell[0] + 2, cell[1]),
+                  (cell[0] - 2, cell[1]),
+                  (cell[0], cell[1] + 2),
+                  (cell[0], cell[1] - 2)]
+
+    return [(row, col) for row, col in neighbours
+            if 0 <= row < height and 0 <= col < width]
+
+
+def _randomised_prims(
+    width: int,
+    height: int,
+    start: tuple[int, int],
+    goal: tuple[int, int],
+    rng: random.Random
+) -> Changes:
+    """Carve a maze with Randomised Prim's algorithm
+
+    Every step opens the wall between a frontier cell and a passage
+    next to it, then the frontier cell.
+
+    Args:
+        width (int): Number of columns
+        height (int): Number of rows
+        start (tuple[int, int]): Start position
+        goal (tuple[int, int]): Goal position
+        rng (random.Random): Random generator
+
+    Returns:
+        Changes: Cell changes in order
+    """
+    passages = {start, goal}
+    changes: Changes = []
+
+    # Walls two steps away from a passage
+    frontier = [cell for cell in _two_step_neighbours(width, height, start)
+                if cell not in passages]
+    visited = set()
+
+    while frontier:
+        cell = rng.choice(frontier)
+
+        # Skip if already visited
+        if cell in visited:
+            frontier.remove(cell)
+            continue
+
+        neighbours = [neighbour for neighbour
+                      in _two_step_neighbours(width, height, cell)
+                      if neighbour in passages]
+
+        # Break the wall between the cell and a passage next to it
+        if neighbours:
+            neighbour = rng.choice(neighbours)
+            wall = ((cell[0] + neighbour[0]) // 2,
+                    (cell[1] + neighbour[1]) // 2)
+
+            passages.update((wall, cell))
+            changes.extend(((wall, "1"), (cell, "1")))
+
+            frontier.extend(
+                neighbour for neighbour
+                in _two_step_neighbours(width, height, cell)
+                if neighbour not in passages
+            )
+
+        visited.add(cell)
+        frontier.remove(cell)
+
+    return changes
+
+
+def _randomised_dfs(
+    width: int,
+    height: int,
+    start: tuple[int, int],
+    rng: random.Random
+) -> Changes:
+    """Carve a maze with randomised depth first search
+
+    Every step opens the next cell, then the wall between it and the
+    current cell.
+
+    Args:
+        width (int): Number of columns
+        height (int): Number of rows
+        start (tuple[int, int]): Start position
+        rng (random.Random): Random generator
+
+    Returns:
+        Changes: Cell changes in order
+    """
+    changes: Changes = []
+    stack = [start]
+    visited = {start}
+
+    while stack:
+        curr = stack.pop()
+
+        unvisited = [neighbour for neighbour
+                     in _two_step_neighbours(width, height, curr)
+                     if neighbour not in visited]
+
+        # Keep the cell on the stack and move on to a random neighbour
+        if unvisited:
+            cell = rng.choice(unvisited)
+            stack.append(curr)
+
+            wall = ((curr[0] + cell[0]) // 2, (curr[1] + cell[1]) // 2)
+            changes.extend(((cell, "1"), (wall, "1")))
+
+            visited.add(cell)
+            stack.append(cell)
+
+    return changes
+
+
+def _scatter(
+    width: int,
+    height: int,
+    value: str,
+    rng: random.Random
+) -> Changes:
+    """Put a value on about 30% of the cells, column by column
+
+    Args:
+        width (int): Number of columns
+        height (int): Number of rows
+        value (str): Cell value
+        rng (random.Random): Random generator
+
+    Returns:
+        Changes: Cell changes in order
+    """
+    return [((row, col), value)
+            for col in range(width)
+            for row in range(height)
+            if rng.randint(1, 10) >= 8]
+
+
+def _walls_around(width: int, height: int) -> Changes:
+    """Get the walls around the maze: top row, bottom row, then both
+    sides row by row
+
+    Args:
+        width (int): Number of columns
+        height (int): Number of rows
+
+    Returns:
+        Changes: Cell changes in order
+    """
+    changes: Changes = [((0, col), "#") for col in range(width)]
+    changes.extend(((height - 1, col), "#") for col in range(width))
+
+    for row in range(height):
+        changes.extend((((row, 0), "#"), ((row, width - 1), "#")))
+
+    return changes
+
+
+def _recursive_division(
+    changes: Changes,
+    rng: random.Random,
+    x1: int,
+    x2: int,
+    y1: int,
+    y2: int
+) -> None:
+    """Divide a chamber with a wall with one hole and recurse into both
+    halves
+
+    Args:
+        changes (Changes): Collects the walls
+        rng (random.Random): Random generator
+        x1 (int): First column
+        x2 (int): Last column
+        y1 (int): First row
+        y2 (int): Last row
+    """
+    width = x2 - x1
+    height = y2 - y1
+
+    if width < 1 or height < 1:
+        return
+
+    # Divide across the longer side, randomly for squares
+    horizontal = True if height > width else (
+        False if width != height else rng.choice((True, False)))
+
+    if horizontal:
+        y = _draw_line(changes, rng, x1, x2, y1, y2, horizontal=True)
+        chambers = [(x1, x2, y1, y - 1), (x1, x2, y + 1, y2)]
+    else:
+        x = _draw_line(changes, rng, x1, x2, y1, y2)
+        chambers = [(x1, x - 1, y1, y2), (x + 1, x2, y1, y2)]
+
+    for chamber in chambers:
+        _recursive_division(changes, rng, *chamber)
+
+
+def _draw_line(
+    changes: Changes,
+    rng: random.Random,
+    x1: int,
+    x2: int,
+    y1: int,
+    y2: int,
+    horizontal: bool = False
+) -> int:
+    """Draw a wall with one hole across a chamber
+
+    Args:
+        changes (Changes): Collects the walls
+        rng (random.Random): Random generator
+        x1 (int): First column
+        x2 (int): Last column
+        y1 (int): First row
+        y2 (int): Last row
+        horizontal (bool, optional): Draw a row instead of a column.
+        Defaults to False.
+
+    Returns:
+        int: Row or column of the wall
+    """
+    if horizontal:
+        x1, y1 = y1, x1
+        x2, y2 = y2, x2
+
+    # Walls at even places
+    if x1 % 2 != 0:
+        x1 += 1
+    wall = rng.randrange(x1, x2, 2)
+
+    # Holes at odd places
+    if y1 % 2 == 0:
+        y1 += 1
+    hole = rng.randrange(y1, y2, 2)
+
+    for i in range(y1, y2 + 1):
+        if i != hole:
+            changes.append(((wall, i) if horizontal else (i, wall), "#"))
+
+    return wall
@@ -0,0 +1,47 @@
+from array import array
+
+
+class ClosedSet:
+    """Model an insertion-ordered set of explored nodes (cell indices)"""
+
+    def __init__(self, size: int) -> None:
+        # Membership bitmap and append-only exploration order
+        self.closed = bytearray(size)
+        self.order = array("I")
+
+    def add(self, node: int) -> bool:
+        """Mark a node as explored
+
+        Args:
+            node (int): Cell index
+
+        Returns:
+            bool: Whether the node was not explored before
+        """
+        if self.closed[node]:
+            return False
+
+        self.closed[node] = 1
+        self.order.append(node)
+
+        return True
+
+    def positions(self, width: int) -> list[tuple[int, int]]:
+        """Get the explored cell positions in exploration order
+
+        Args:
+            width (int): Grid width
+
+        Returns:
+            list[tuple[int, int]]: Cell positions
+        """
+        return [divmod(node, width) for node in self.order]
+
+    def __contains__(self, node: int) -> bool:
+        return self.closed[node] == 1
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __repr__(self) -> str:
+        return f"ClosedSet({len(self.order)} of {len(self.closed)})"
@@ -1,32 +1,40 @@
-from heapq import heappush, heappop
+from collections import deque
 
-from .node import Node
+# Lower is popped first; tuples allow secondary keys (e.g. f then h)
+Priority = int | tuple[int, ...]
 
 
 class Frontier:
-    """Model a frontier for managing nodes"""
+    """Model a frontier for managing nodes (cell indices of a grid)
+
+    Nodes are kept in a deque alongside a set of the queued nodes, so
+    adding, removing and membership checks are all O(1). A node is
+    expected to be in the frontier at most once.
+    """
 
     def __init__(self) -> None:
-        self.frontier: list[Node] = []
+        self.frontier: deque[int] = deque()
+        self.members: set[int] = set()
 
-    def add(self, node: Node) -> None:
+    def add(self, node: int) -> None:
         """Add a new node to the frontier
 
         Args:
-            node (Node): Maze node
+            node (int): Cell index
         """
         self.frontier.append(node)
+        self.members.add(node)
 
-    def contains_state(self, state: tuple[int, int]) -> bool:
+    def contains_state(self, state: int) -> bool:
         """Check if a state exists in the frontier
 
         Args:
-            state (tuple[int, int]): Postion of a node
+            state (int): Cell index
 
         Returns:
             bool: Whether the provided state exists
         """
-        return any(node.state == state for node in self.frontier)
+        return state in self.members
 
     def is_empty(self) -> bool:
         """Check if the frontier is empty
@@ -44,70 +52,332 @@ class Frontier:
 
 
 class StackFrontier(Frontier):
-    def remove(self) -> Node:
+    def remove(self) -> int:
         """Remove element from the stack
 
         Raises:
             Exception: Empty Frontier
 
         Returns:
-            Node: Cell (Node) in a matrix
+            int: Cell index
         """
         if self.is_empty():
             raise Exception("Empty Frontier")
         else:
-            return self.frontier.pop()
+            node = self.frontier.pop()
+            self.members.discard(node)
+            return node
 
 
 class QueueFrontier(Frontier):
-    def remove(self) -> Node:
+    def remove(self) -> int:
         """Remove element from the queue
 
         Raises:
             Exception: Empty Frontier
 
         Returns:
-            Node: Cell (Node) in a matrix
+            int: Cell index
         """
         if self.is_empty():
             raise Exception("Empty Frontier")
         else:
-            return self.frontier.pop(0)
+            node = self.frontier.popleft()
+            self.members.discard(node)
+            return node
 
 
 class PriorityQueueFrontier(Frontier):
+    """Indexed binary heap with decrease-key
+
+    Every node is held at most once. Adding a node that is already in the
+    frontier lowers its priority if the new one is better and is ignored
+    otherwise. Equal priorities are popped in order of cell index, so the
+    pop order does not depend on insertion history.
+    """
+
     def __init__(self):
-        self.frontier: list[tuple[int, Node]] = []
+        self.frontier: list[tuple[Priority, int]] = []
+
+        # Node -> position of its entry in the heap
+        self.positions: dict[int, int] = {}
 
-    def add(self, node: Node, priority: int = 0) -> None:
-        """Add a new node into the frontier
+        # Operation counters
+        self.pushes = 0
+        self.pops = 0
+        self.updates = 0
+        self.max_size = 0
+
+    def add(self, node: int, priority: Priority = 0) -> None:
+        """Add a new node into the frontier or lower its priority
 
         Args:
-            node (AStarNode): Maze node
-            priority (int, optional): Node priority. Defaults to 0.
+            node (int): Cell index
+            priority (Priority, optional): Node priority. Defaults to 0.
+        """
+        pos = self.positions.get(node)
+
+        if pos is None:
+            self.frontier.append((priority, node))
+            self.positions[node] = len(self.frontier) - 1
+            self._sift_up(len(self.frontier) - 1)
+
+            self.pushes += 1
+            self.max_size = max(self.max_size, len(self.frontier))
+
+        elif priority < self.frontier[pos][0]:
+            self.frontier[pos] = (priority, node)
+            self._sift_up(pos)
+            self.updates += 1
+
+    def update(self, node: int, priority: Priority) -> None:
+        """Add a new node into the frontier or change its priority, up or
+        down
+
+        Args:
+            node (int): Cell index
+            priority (Priority): Node priority
+        """
+        pos = self.positions.get(node)
+
+        if pos is None:
+            self.add(node, priority)
+            return
+
+        previous = self.frontier[pos][0]
+        self.frontier[pos] = (priority, node)
+
+        if priority < previous:
+            self._sift_up(pos)
+        else:
+            self._sift_down(pos)
+
+        self.updates += 1
+
+    def discard(self, state: int) -> None:
+        """Remove a node from the frontier if it is there
+
+        Args:
+            state (int): Cell index
+        """
+        pos = self.positions.pop(state, None)
+        if pos is None:
+            return
+
+        heap = self.frontier
+        last = heap.pop()
+
+        if pos < len(heap):
+            heap[pos] = last
+            self.positions[last[1]] = pos
+            self._sift_up(pos)
+            self._sift_down(self.positions[last[1]])
+
+    def contains_state(self, state: int) -> bool:
+        """Check if a state exists in the frontier
+
+        Args:
+            state (int): Cell index
+
+        Returns:
+            bool: Whether the provided state exists
+        """
+        return state in self.positions
+
+    def get(self, state: int) -> int | None:
+        """Get node by state
+
+        Args:
+            state (int): Cell index
+
+        Returns:
+            int | None: The node if it is in the frontier
         """
-        heappush(self.frontier, (priority, node))
+        return state if state in self.positions else None
 
-    def get(self, state: tuple[int, int]) -> Node | None:
-        """Get node by state. Create new if not found
+    def priority(self, state: int) -> Priority | None:
+        """Get the current priority of a node
 
         Args:
-            state (tuple[int, int]): State
+            state (int): Cell index
 
         Returns:
-            Node: Required node
+            Priority | None: Priority if the node is in the frontier
         """
-        for _, node in self.frontier:
-            if node.state == state:
-                return node
+        pos = self.positions.get(state)
+        return None if pos is None else self.frontier[pos][0]
 
-        return None
+    def peek(self) -> tuple[Priority, int]:
+        """Get the entry that would be popped next
+
+        Returns:
+            tuple[Priority, int]: Priority and cell index
+        """
+        return self.frontier[0]
 
-    def pop(self) -> Node:
+    def pop(self) -> int:
         """Remove a node from the frontier
 
+        Raises:
+            Exception: Empty Frontier
+
         Returns:
-            AStarNode: Node to be removed
+            int: Cell index of the node
         """
-        _, node = heappop(self.frontier)
+        if self.is_empty():
+            raise Exception("Empty Frontier")
+
+        heap = self.frontier
+        _, node = heap[0]
+        last = heap.pop()
+        del self.positions[node]
+
+        if heap:
+            heap[0] = last
+            self.positions[last[1]] = 0
+            self._sift_down(0)
+
+        self.pops += 1
         return node
+
+    def _sift_up(self, pos: int) -> None:
+        """Move an entry towards the root until the heap is ordered
+
+        Args:
+            pos (int): Position of the entry
+        """
+        heap = self.frontier
+        positions = self.positions
+        entry = heap[pos]
+
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if not entry < heap[parent]:
+                break
+
+            heap[pos] = heap[parent]
+            positions[heap[pos][1]] = pos
+            pos = parent
+
+        heap[pos] = entry
+        positions[entry[1]] = pos
+
+    def _sift_down(self, pos: int) -> None:
+        """Move an entry towards the leaves until the heap is ordered
+
+        Args:
+            pos (int): Position of the entry
+        """
+        heap = self.frontier
+        positions = self.positions
+        size = len(heap)
+        entry = heap[pos]
+
+        while True:
+            child = 2 * pos + 1
+            if child >= size:
+                break
+
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+
+            if not heap[child] < entry:
+                break
+
+            heap[pos] = heap[child]
+            positions[heap[pos][1]] = pos
+            pos = child
+
+        heap[pos] = entry
+        positions[entry[1]] = pos
+
+
+class BucketQueueFrontier(Frontier):
+    """Circular bucket queue for small integer priorities (Dial's
+    algorithm)
+
+    Bucket `p % len(buckets)` holds the nodes of priority `p`. Queued
+    priorities must stay within `max_step` of the last popped one, which
+    holds for Dijkstra's Search when no move costs more than `max_step`.
+    Adding and popping are O(1) (amortised over the empty buckets
+    skipped). Lowering a priority leaves the old entry behind, which is
+    skipped when its bucket is reached.
+    """
+
+    def __init__(self, max_step: int) -> None:
+        self.frontier: list[list[int]] = [[] for _ in range(max_step + 1)]
+
+        # Node -> current priority
+        self.priorities: dict[int, int] = {}
+
+        # Lowest priority that can still be queued
+        self.current = 0
+
+        # Operation counters
+        self.pushes = 0
+        self.pops = 0
+
+    def add(self, node: int, priority: int = 0) -> None:
+        """Add a new node into the frontier or lower its priority
+
+        Args:
+            node (int): Cell index
+            priority (int, optional): Node priority. Defaults to 0.
+        """
+        priorities = self.priorities
+        if node in priorities and priority >= priorities[node]:
+            return
+
+        priorities[node] = priority
+        self.frontier[priority % len(self.frontier)].append(node)
+        self.pushes += 1
+
+    def contains_state(self, state: int) -> bool:
+        """Check if a state exists in the frontier
+
+        Args:
+            state (int): Cell index
+
+        Returns:
+            bool: Whether the provided state exists
+        """
+        return state in self.priorities
+
+    def is_empty(self) -> bool:
+        """Check if the frontier is empty
+
+        Returns:
+            bool: Whether the frontier is empty
+        """
+        return not self.priorities
+
+    def pop(self) -> int:
+        """Remove a node with the lowest priority from the frontier
+
+        Raises:
+            Exception: Empty Frontier
+
+        Returns:
+            int: Cell index of the node
+        """
+        if self.is_empty():
+            raise Exception("Empty Frontier")
+
+        buckets = self.frontier
+        priorities = self.priorities
+        current = self.current
+
+        while True:
+            bucket = buckets[current % len(buckets)]
+
+            while bucket:
+                node = bucket.pop()
+
+                # Skip entries left behind by a lowered priority
+                if priorities.get(node) == current:
+                    del priorities[node]
+                    self.current = current
+                    self.pops += 1
+                    return node
+
+            current += 1
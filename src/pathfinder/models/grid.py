@@ -1,20 +1,198 @@
+import struct
+import sys
+from array import array
+from typing import Callable
+
 from src.pathfinder.models.node import Node
 
+# Distance of unreached cells in per-query score arrays
+INFINITY = 0xFFFFFFFF
+
+# Action names indexed by the action codes stored in the adjacency index
+ACTIONS = ("up", "down", "left", "right")
+
+# Row and column step of every action code
+MOVES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# Serialised header: width, height, start row/col, end row/col
+HEADER = struct.Struct("<6I")
+
+# Side of the square blocks of cells with their own edit counter
+REGION = 16
+
+# Fingerprints are cut to 64 bits
+MASK = (1 << 64) - 1
+
+# Hashed state of a wall, above every cost
+WALL = 1 << 16
+
+# Hashed states of the start and end, above every cost and WALL (not
+# -1 and -2, which Python hashes alike)
+START_KEY = WALL + 1
+END_KEY = WALL + 2
+
+
+def _cell_key(idx: int, state: int) -> int:
+    """Get the fingerprint key of a cell in a state
+
+    Keys are hashes of (index, state) tuples, which Python does not salt
+    for integers and computes in C. Open cells of weight 1 have the key
+    0, so only the other cells need hashing when the fingerprint is
+    first computed.
+
+    Args:
+        idx (int): Cell index
+        state (int): Weight of the cell, WALL for a wall
+
+    Returns:
+        int: Key
+    """
+    return 0 if state == 1 else hash((idx, state))
+
 
 class Grid:
     def __init__(
         self,
-        grid: list[list[Node]],
+        walls: bytearray,
+        costs: array,
+        width: int,
+        height: int,
         start: tuple[int, int],
         end: tuple[int, int]
     ) -> None:
-        self.grid: list[list[Node]] = grid
+        # Flat row-major storage: cell (row, col) lives at row * width + col
+        self.walls = walls
+        self.costs = costs
         self.start = start
         self.end = end
 
-        # Calculate grid dimensions
-        self.width = max(len(row) for row in grid)
-        self.height = len(grid)
+        # Grid dimensions
+        self.width = width
+        self.height = height
+
+        # Neighbour index, built on first use and dropped on wall edits
+        self._adjacency: tuple[array, array, bytearray] | None = None
+
+        # Highest cell cost, computed on first use and dropped on edits
+        self._max_cost: int | None = None
+
+        # Hash of the cells, computed on first use and then kept up to
+        # date by every edit
+        self._hash: int | None = None
+
+        # Number of edits to the whole grid and to every REGION x REGION
+        # block of cells (see `region`)
+        self.version = 0
+        self.region_columns = -(-width // REGION)
+        self.region_versions = array("Q", [0]) \
+            * (self.region_columns * -(-height // REGION))
+
+        # Called with the cell index whenever a cell changes
+        self.listeners: list[Callable[[int], None]] = []
+
+    @classmethod
+    def from_nodes(
+        cls,
+        grid: list[list[Node]],
+        start: tuple[int, int],
+        end: tuple[int, int]
+    ) -> "Grid":
+        """Build a grid from a matrix of nodes
+
+        Args:
+            grid (list[list[Node]]): Node matrix
+            start (tuple[int, int]): Start position
+            end (tuple[int, int]): End position
+
+        Returns:
+            Grid: Array-backed grid
+        """
+        width = max(len(row) for row in grid)
+        height = len(grid)
+
+        walls = bytearray(width * height)
+        costs = array("H", bytes(2 * width * height))
+
+        for row in grid:
+            for node in row:
+                idx = node.state[0] * width + node.state[1]
+
+                if node.value == "#":
+                    walls[idx] = 1
+                else:
+                    costs[idx] = node.cost
+
+        return cls(walls, costs, width, height, start, end)
+
+    def to_bytes(self) -> bytes:
+        """Serialise the grid compactly (header, walls, costs)
+
+        Returns:
+            bytes: Serialised grid
+        """
+        # Costs are stored little-endian like the header
+        costs = array("H", self.costs)
+        if sys.byteorder == "big":
+            costs.byteswap()
+
+        return HEADER.pack(self.width, self.height, *self.start, *self.end) \
+            + bytes(self.walls) + costs.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Grid":
+        """Rebuild a grid serialised by `to_bytes`
+
+        Args:
+            data (bytes): Serialised grid
+
+        Returns:
+            Grid: New grid
+        """
+        width, height, *ends = HEADER.unpack_from(data)
+        size = width * height
+        offset = HEADER.size
+
+        walls = bytearray(data[offset:offset + size])
+        costs = array("H")
+        costs.frombytes(data[offset + size:offset + 3 * size])
+        if sys.byteorder == "big":
+            costs.byteswap()
+
+        return cls(walls, costs, width, height,
+                   (ends[0], ends[1]), (ends[2], ends[3]))
+
+    def index(self, pos: tuple[int, int]) -> int:
+        """Get flat array index of a cell
+
+        Args:
+            pos (tuple[int, int]): Cell position
+
+        Returns:
+            int: Index
+        """
+        return pos[0] * self.width + pos[1]
+
+    def position(self, idx: int) -> tuple[int, int]:
+        """Get cell position from a flat array index
+
+        Args:
+            idx (int): Index
+
+        Returns:
+            tuple[int, int]: Cell position
+        """
+        return divmod(idx, self.width)
+
+    def is_wall(self, pos: tuple[int, int]) -> bool:
+        """Check if a cell is a wall
+
+        Args:
+            pos (tuple[int, int]): Cell position
+
+        Returns:
+            bool: Whether the cell is a wall
+        """
+        return self.walls[pos[0] * self.width + pos[1]] == 1
 
     def get_node(self, pos: tuple[int, int]) -> Node:
         """Get node by position
@@ -23,9 +201,14 @@ class Grid:
             pos (tuple[int, int]): Cell position
 
         Returns:
-            int: Weight
+            Node: A new node for the cell
         """
-        return self.grid[pos[0]][pos[1]]
+        idx = pos[0] * self.width + pos[1]
+
+        if self.walls[idx]:
+            return Node("#", pos, -1)
+
+        return Node(str(self.costs[idx]), pos, self.costs[idx])
 
     def get_cost(self, pos: tuple[int, int]) -> int:
         """Get weight of a node
@@ -36,7 +219,226 @@ class Grid:
         Returns:
             int: Weight
         """
-        return self.grid[pos[0]][pos[1]].cost
+        return self.costs[pos[0] * self.width + pos[1]]
+
+    def set_wall(self, pos: tuple[int, int]) -> None:
+        """Turn a cell into a wall
+
+        Args:
+            pos (tuple[int, int]): Cell position
+        """
+        idx = pos[0] * self.width + pos[1]
+        if self.walls[idx]:
+            return
+
+        self._adjacency = None
+        self._max_cost = None
+        previous = self.costs[idx]
+
+        self.walls[idx] = 1
+        self.costs[idx] = 0
+
+        self._record(idx, previous)
+        self._notify(idx)
+
+    def set_cost(self, pos: tuple[int, int], cost: int) -> None:
+        """Turn a cell into an open cell with the given weight
+
+        Args:
+            pos (tuple[int, int]): Cell position
+            cost (int): Weight
+        """
+        idx = pos[0] * self.width + pos[1]
+        if not self.walls[idx] and self.costs[idx] == cost:
+            return
+
+        if self.walls[idx]:
+            self._adjacency = None
+
+        self._max_cost = None
+        previous = WALL if self.walls[idx] else self.costs[idx]
+
+        self.walls[idx] = 0
+        self.costs[idx] = cost
+
+        self._record(idx, previous)
+        self._notify(idx)
+
+    def _record(self, idx: int, previous: int) -> None:
+        """Update the hash and edit counters after a cell changed
+
+        Args:
+            idx (int): Index of the changed cell
+            previous (int): Weight of the cell before the change, WALL
+            for a wall
+        """
+        if self._hash is not None:
+            state = WALL if self.walls[idx] else self.costs[idx]
+            self._hash ^= _cell_key(idx, previous) ^ _cell_key(idx, state)
+
+        self.version += 1
+        self.region_versions[self.region(idx)] += 1
+
+    def _notify(self, idx: int) -> None:
+        """Tell every listener that a cell changed
+
+        Args:
+            idx (int): Index of the changed cell
+        """
+        for listener in self.listeners:
+            listener(idx)
+
+    def max_cost(self) -> int:
+        """Get the highest cost of any open cell
+
+        Returns:
+            int: Highest cost (1 on a grid without weighted cells)
+        """
+        if self._max_cost is None:
+            self._max_cost = max(self.costs, default=0)
+
+        return self._max_cost
+
+    def fingerprint(self) -> int:
+        """Get a Zobrist hash of the size, cells, start and end of the
+        grid
+
+        Every cell state and endpoint has a pseudo-random key and the
+        fingerprint is the XOR of the keys that apply. Equal grids
+        have equal fingerprints. The first call hashes every cell that
+        is not an open cell of weight 1; afterwards every edit updates
+        the hash in constant time and endpoints are mixed in per call.
+
+        Returns:
+            int: 64 bit fingerprint
+        """
+        if self._hash is None:
+            value = hash((self.width, self.height))
+            walls = self.walls
+
+            # Inlined _cell_key, this loop visits every cell
+            for idx, cost in enumerate(self.costs):
+                if walls[idx]:
+                    value ^= hash((idx, WALL))
+                elif cost != 1:
+                    value ^= hash((idx, cost))
+
+            self._hash = value
+
+        start = self.start[0] * self.width + self.start[1]
+        end = self.end[0] * self.width + self.end[1]
+
+        return (self._hash ^ hash((start, START_KEY))
+                ^ hash((end, END_KEY))) & MASK
+
+    def region(self, idx: int) -> int:
+        """Get the region of a cell
+
+        Regions are REGION x REGION blocks of cells numbered row by row.
+        `region_versions[region]` counts the edits in a region, so a
+        copy of `region_versions` taken after a computation tells which
+        regions changed since (see `changed_regions`).
+
+        Args:
+            idx (int): Cell index
+
+        Returns:
+            int: Region number
+        """
+        row, col = divmod(idx, self.width)
+        return (row // REGION) * self.region_columns + col // REGION
+
+    def changed_regions(self, versions: array) -> list[int]:
+        """Get the regions edited since a copy of `region_versions` was
+        taken
+
+        Args:
+            versions (array): Earlier copy of `region_versions`
+
+        Returns:
+            list[int]: Region numbers
+        """
+        return [region for region, (now, then)
+                in enumerate(zip(self.region_versions, versions))
+                if now != then]
+
+    def adjacency(self) -> tuple[array, array, bytearray]:
+        """Get the neighbour index of the grid
+
+        The neighbours of the cell at index `i` are
+        `targets[offsets[i]:offsets[i + 1]]`, reached by the actions
+        `actions[offsets[i]:offsets[i + 1]]` (codes into `ACTIONS`).
+        Walls have no neighbours and are never neighbours.
+
+        Returns:
+            tuple[array, array, bytearray]: Offsets, targets and actions
+        """
+        if self._adjacency is None:
+            self._adjacency = self._build_adjacency()
+
+        return self._adjacency
+
+    def _build_adjacency(self) -> tuple[array, array, bytearray]:
+        """Build the neighbour index (CSR layout)
+
+        Returns:
+            tuple[array, array, bytearray]: Offsets, targets and actions
+        """
+        width, height = self.width, self.height
+        walls = self.walls
+
+        offsets = array("I", [0])
+        targets = array("I")
+        actions = bytearray()
+
+        for idx in range(width * height):
+            if not walls[idx]:
+                row, col = divmod(idx, width)
+
+                # Same order as ACTIONS: up, down, left, right
+                if row > 0 and not walls[idx - width]:
+                    targets.append(idx - width)
+                    actions.append(0)
+                if row < height - 1 and not walls[idx + width]:
+                    targets.append(idx + width)
+                    actions.append(1)
+                if col > 0 and not walls[idx - 1]:
+                    targets.append(idx - 1)
+                    actions.append(2)
+                if col < width - 1 and not walls[idx + 1]:
+                    targets.append(idx + 1)
+                    actions.append(3)
+
+            offsets.append(len(targets))
+
+        return offsets, targets, actions
+
+    def get_path(
+        self,
+        parents: array,
+        idx: int
+    ) -> tuple[list[tuple[int, int]], int]:
+        """Follow parent links from a cell back to the root of the search
+
+        Args:
+            parents (array): Parent index of every cell, -1 for none
+            idx (int): Index of the last cell
+
+        Returns:
+            tuple[list[tuple[int, int]], int]: Path from the root and its cost
+        """
+        cells = []
+        path_cost = 0
+
+        while parents[idx] != -1:
+            cells.append(divmod(idx, self.width))
+            path_cost += self.costs[idx]
+            idx = parents[idx]
+
+        cells.append(divmod(idx, self.width))
+        cells.reverse()
+
+        return cells, path_cost
 
     def get_neighbours(
         self,
@@ -51,33 +453,13 @@ class Grid:
             dict[str, tuple[int, int]]: Action - Position Mapper
         """
 
-        row, col = pos
+        offsets, targets, actions = self.adjacency()
+        idx = pos[0] * self.width + pos[1]
 
-        # Map actions with resulting cell positions
-        action_pos_mapper = {
-            "up": (row - 1, col),
-            "down": (row + 1, col),
-            "left": (row, col - 1),
-            "right": (row, col + 1),
-            # "upleft": (row - 1, col - 1),
-            # "upright": (row - 1, col + 1),
-            # "downleft": (row + 1, col - 1),
-            # "downright": (row + 1, col + 1),
+        return {
+            ACTIONS[actions[k]]: divmod(targets[k], self.width)
+            for k in range(offsets[idx], offsets[idx + 1])
         }
 
-        # Determine possilbe actions
-        possible_actions = {}
-
-        for action, (r, c) in action_pos_mapper.items():
-            if not (0 <= r < self.height and 0 <= c < self.width):
-                continue
-
-            if self.grid[r][c].value == "#":
-                continue
-
-            possible_actions[action] = (r, c)
-
-        return possible_actions
-
     def __repr__(self) -> str:
-        return f"Grid([[...], ...], {self.start}, {self.end})"
+        return f"Grid({self.width}x{self.height}, {self.start}, {self.end})"
@@ -9,3 +9,12 @@ class Search(Enum):
     BREADTH_FIRST_SEARCH = "BFS"
     GREEDY_BEST_FIRST_SEARCH = "GBFS"
     DEPTH_FIRST_SEARCH = "DFS"
+    BIDIRECTIONAL_BFS = "BiBFS"
+    BIDIRECTIONAL_ASTAR = "BiA*"
+    JUMP_POINT_SEARCH = "JPS"
+    HPA_STAR = "HPA*"
+    ALT_SEARCH = "ALT"
+    DSTAR_LITE = "D* Lite"
+    FLOW_FIELD = "Flow Field"
+    VECTORISED_BFS = "VBFS"
+    ARA_STAR = "ARA*"
@@ -1,3 +1,9 @@
+from array import array
+from collections.abc import Iterator, Sequence
+
+from .grid import MOVES
+
+
 class Solution:
     """Model a solution to a pathfinding problem"""
 
@@ -6,7 +12,10 @@ class Solution:
         path: list[tuple[int, int]],
         explored: list[tuple[int, int]],
         time: float = 0,
-        path_cost: int = 0
+        path_cost: int = 0,
+        preprocessing_time: float = 0,
+        bound: float | None = None,
+        jump_points: list[tuple[int, int]] | None = None
     ) -> None:
         self.path = path
         self.path_cost = path_cost
@@ -15,6 +24,16 @@ class Solution:
         self.explored_length = len(explored)
         self.time = time
 
+        # Part of `time` spent building reusable data for the grid
+        self.preprocessing_time = preprocessing_time
+
+        # Most times the cheapest path cost the path may cost, None when
+        # the search does not say
+        self.bound = bound
+
+        # Jump points expanded by Jump Point Search, empty for others
+        self.jump_points = [] if jump_points is None else jump_points
+
     def __repr__(self) -> str:
         return (f"Solution([{self.path[0]}, ..., {self.path[-1]}],"
                 f" {'{...}'}, {self.time})")
@@ -27,3 +46,165 @@ class NoSolution(Solution):
         explored = list(self.explored)
         return (f"NoSolution([], {'{'}{explored[0]}, {explored[1]},"
                 f" ...{'}'}, {self.time})")
+
+
+class ExploredView(Sequence):
+    """Read-only list of cell positions decoded from cell indices"""
+
+    def __init__(self, indices: array, width: int) -> None:
+        self.indices = indices
+        self.width = width
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [divmod(idx, self.width) for idx in self.indices[key]]
+
+        return divmod(self.indices[key], self.width)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        width = self.width
+        for idx in self.indices:
+            yield divmod(idx, width)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+
+class PathView(Sequence):
+    """Read-only list of cell positions decoded from a first cell and
+    move codes"""
+
+    def __init__(self, start: int, moves: bytes, width: int) -> None:
+        self.start = start
+        self.moves = moves
+        self.width = width
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return list(self)[key]
+
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("path index out of range")
+
+        # Walk the moves up to the requested cell
+        row, col = divmod(self.start, self.width)
+        for code in self.moves[:key]:
+            row += MOVES[code][0]
+            col += MOVES[code][1]
+
+        return row, col
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        if self.start == -1:
+            return
+
+        row, col = divmod(self.start, self.width)
+        yield row, col
+
+        for code in self.moves:
+            row += MOVES[code][0]
+            col += MOVES[code][1]
+            yield row, col
+
+    def __len__(self) -> int:
+        return 0 if self.start == -1 else len(self.moves) + 1
+
+
+class CompactSolution(Solution):
+    """Model a solution kept in flat arrays
+
+    Explored cells are stored as cell indices (4 bytes each) and the path
+    as its first cell plus one move code per step (an index into MOVES,
+    1 byte each) instead of a tuple per cell. `path` and `explored`
+    decode positions on access, so existing consumers work unchanged.
+    Jump points are stored as cell indices like explored cells.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        explored: array,
+        start: int = -1,
+        moves: bytes = b"",
+        time: float = 0,
+        path_cost: int = 0,
+        preprocessing_time: float = 0,
+        bound: float | None = None,
+        jump_points: array | None = None
+    ) -> None:
+        self.width = width
+
+        # Explored cell indices, first path cell (-1 if none) and moves
+        self.explored_indices = explored
+        self.start = start
+        self.moves = moves
+        self.jump_indices = array("I") if jump_points is None \
+            else jump_points
+
+        self.path_cost = path_cost
+        self.path_length = 0 if start == -1 else len(moves) + 1
+        self.explored_length = len(explored)
+        self.time = time
+        self.preprocessing_time = preprocessing_time
+        self.bound = bound
+
+    @property
+    def path(self) -> PathView:
+        return PathView(self.start, self.moves, self.width)
+
+    @property
+    def explored(self) -> ExploredView:
+        return ExploredView(self.explored_indices, self.width)
+
+    @property
+    def jump_points(self) -> ExploredView:
+        return ExploredView(self.jump_indices, self.width)
+
+    @classmethod
+    def from_solution(cls, solution: Solution, width: int) \
+            -> "CompactSolution":
+        """Encode a solution
+
+        Args:
+            solution (Solution): Solution with position lists
+            width (int): Grid width
+
+        Raises:
+            ValueError: Consecutive path cells are not neighbours
+
+        Returns:
+            CompactSolution: Equivalent compact solution
+        """
+        explored = array("I", (row * width + col
+                               for row, col in solution.explored))
+        jump_points = array("I", (row * width + col
+                                  for row, col in solution.jump_points))
+
+        start = -1
+        moves = bytearray()
+        if solution.path:
+            start = solution.path[0][0] * width + solution.path[0][1]
+
+            for (r1, c1), (r2, c2) in zip(solution.path, solution.path[1:]):
+                moves.append(MOVES.index((r2 - r1, c2 - c1)))
+
+        return cls(
+            width,
+            explored,
+            start,
+            bytes(moves),
+            time=solution.time,
+            path_cost=solution.path_cost,
+            preprocessing_time=solution.preprocessing_time,
+            bound=solution.bound,
+            jump_points=jump_points
+        )
+
+    def __repr__(self) -> str:
+        if self.start == -1:
+            return f"CompactSolution(no path, {self.time})"
+
+        return (f"CompactSolution([{self.path[0]}, ..., {self.path[-1]}],"
+                f" {'{...}'}, {self.time})")
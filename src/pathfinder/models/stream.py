@@ -0,0 +1,23 @@
+from typing import Generator
+
+from .solution import Solution
+
+# Search run one expansion at a time: yields the index of every explored
+# cell in order and returns the solution
+SolutionStream = Generator[int, None, Solution]
+
+
+def drain(stream: SolutionStream) -> Solution:
+    """Run a search stream to the end
+
+    Args:
+        stream (SolutionStream): Search stream
+
+    Returns:
+        Solution: Solution found
+    """
+    try:
+        while True:
+            next(stream)
+    except StopIteration as stop:
+        return stop.value
@@ -0,0 +1,66 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+from .main import PathFinder
+from .models.grid import Grid
+from .models.search_types import Search
+
+# Solution fields collected from the workers
+METRICS = ("explored_length", "path_length", "path_cost", "time")
+
+
+def solve(task: tuple[bytes, str]) -> dict[str, float]:
+    """Run one search on one serialised grid (in a worker process)
+
+    Args:
+        task (tuple[bytes, str]): Grid from `Grid.to_bytes` and the
+        value of a Search
+
+    Returns:
+        dict[str, float]: Metrics of the solution
+    """
+    data, search = task
+    solution = PathFinder.find_path(Grid.from_bytes(data), Search(search))
+
+    return {metric: getattr(solution, metric) for metric in METRICS}
+
+
+def compare(
+    grids: list[bytes],
+    searches: list[Search],
+    processes: int | None = None
+) -> dict[Search, dict[str, float]]:
+    """Run every search on every grid in a pool of worker processes
+
+    Grids travel to the workers in the compact form of `Grid.to_bytes`
+    and only the metrics come back. Every search runs on a fresh copy
+    of the grid, so cached preprocessing is included in its time.
+
+    Args:
+        grids (list[bytes]): Serialised grids
+        searches (list[Search]): Searches to compare
+        processes (int | None, optional): Number of workers. Defaults to
+        the number of CPUs.
+
+    Returns:
+        dict[Search, dict[str, float]]: Metrics of every search averaged
+        over the grids (lengths and costs rounded down)
+    """
+    tasks = [(data, search.value) for search in searches for data in grids]
+
+    # Workers must not inherit the GUI's display connection
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(processes, mp_context=context) as executor:
+        metrics = list(executor.map(solve, tasks, chunksize=len(grids)))
+
+    results = {}
+    for i, search in enumerate(searches):
+        runs = metrics[i * len(grids):(i + 1) * len(grids)]
+
+        results[search] = {
+            metric: sum(run[metric] for run in runs) // len(runs)
+            for metric in METRICS if metric != "time"
+        }
+        results[search]["time"] = sum(run["time"] for run in runs) / len(runs)
+
+    return results
@@ -0,0 +1,162 @@
+"""Run searches a slice at a time from a game loop
+
+A search run in one go blocks the loop that called it: no events are
+handled and no frames drawn until it returns. The scheduler instead
+advances its searches for a bounded time (and, optionally, number of
+expansions) every time it is stepped, so a caller stepping it once per
+frame stays responsive however long the search takes.
+"""
+import time
+from collections import deque
+from itertools import islice
+from typing import Callable
+
+from .main import SearchStream
+from .models.solution import Solution
+
+# Called with the cells explored during a step
+CellsCallback = Callable[[list[tuple[int, int]]], None]
+
+# Called with the solution once a search is done
+DoneCallback = Callable[[Solution], None]
+
+# Expansions between two reads of the clock
+CHUNK = 64
+
+
+class SearchTask:
+    """Model a search run by a SearchScheduler"""
+
+    def __init__(
+        self,
+        stream: SearchStream,
+        on_cells: CellsCallback | None = None,
+        on_done: DoneCallback | None = None
+    ) -> None:
+        self.stream = stream
+        self.on_cells = on_cells
+        self.on_done = on_done
+
+    @property
+    def explored(self) -> int:
+        """Number of cells explored so far"""
+        return self.stream.explored
+
+    @property
+    def elapsed(self) -> float:
+        """Milliseconds spent searching so far"""
+        return self.stream.elapsed * 1000
+
+    @property
+    def solution(self) -> Solution | None:
+        """Solution found, None until the search is done"""
+        return self.stream.solution
+
+    def __repr__(self) -> str:
+        return f"SearchTask(explored={self.explored}, " \
+            f"done={self.solution is not None})"
+
+
+class SearchScheduler:
+    """Advance searches within a budget every step, oldest first
+
+    Searches without a stream of their own (see STREAM) still run to
+    completion in the step that starts them.
+    """
+
+    def __init__(
+        self,
+        budget: float = 5.0,
+        expansions: int | None = None
+    ) -> None:
+        """Create a scheduler
+
+        Args:
+            budget (float, optional): Milliseconds of searching per step.
+            Defaults to 5.0.
+            expansions (int | None, optional): Most cells explored per
+            step. Defaults to no limit.
+        """
+        self.budget = budget
+        self.expansions = expansions
+        self.tasks: deque[SearchTask] = deque()
+
+    @property
+    def busy(self) -> bool:
+        """Whether any search is still running"""
+        return bool(self.tasks)
+
+    @property
+    def active(self) -> SearchTask | None:
+        """Search advanced by the next step, None when idle"""
+        return self.tasks[0] if self.tasks else None
+
+    def start(
+        self,
+        stream: SearchStream,
+        on_cells: CellsCallback | None = None,
+        on_done: DoneCallback | None = None
+    ) -> SearchTask:
+        """Queue a search, run after the ones already queued
+
+        Args:
+            stream (SearchStream): Search to run
+            on_cells (CellsCallback | None, optional): Called after every
+            step with the cells it explored. Defaults to None.
+            on_done (DoneCallback | None, optional): Called with the
+            solution once the search is done. Defaults to None.
+
+        Returns:
+            SearchTask: Queued search
+        """
+        task = SearchTask(stream, on_cells, on_done)
+        self.tasks.append(task)
+
+        return task
+
+    def cancel(self, task: SearchTask | None = None) -> None:
+        """Drop a search without calling its callbacks
+
+        Args:
+            task (SearchTask | None, optional): Search to drop. Defaults
+            to every search.
+        """
+        if task is None:
+            self.tasks.clear()
+        elif task in self.tasks:
+            self.tasks.remove(task)
+
+    def step(self) -> None:
+        """Advance the queued searches until the budget runs out
+
+        A search that finishes within the budget hands what is left of
+        it to the next one.
+        """
+        deadline = time.perf_counter() + self.budget / 1000
+        left = self.expansions
+
+        while self.tasks:
+            task = self.tasks[0]
+            cells: list[tuple[int, int]] = []
+
+            # Check the clock every few expansions, not after each one;
+            # the stream sets its solution once exhausted
+            while task.solution is None and left != 0 \
+                    and time.perf_counter() < deadline:
+                count = CHUNK if left is None else min(CHUNK, left)
+                chunk = list(islice(task.stream, count))
+                cells.extend(chunk)
+
+                if left is not None:
+                    left -= len(chunk)
+
+            if cells and task.on_cells:
+                task.on_cells(cells)
+
+            if task.solution is None:
+                return
+
+            # The cells callback may have cancelled it already
+            self.cancel(task)
+            if task.on_done:
+                task.on_done(task.solution)
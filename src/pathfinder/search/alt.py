@@ -0,0 +1,188 @@
+import time
+from array import array
+from typing import Callable
+from weakref import WeakKeyDictionary
+
+from .astar import AStarSearch
+from .dijkstras import DijkstrasSearch
+from ..models.grid import INFINITY, Grid
+from ..models.solution import Solution
+
+
+class LandmarkTable:
+    """Model precomputed costs between landmark cells and every cell
+
+    For a landmark `L` and any cells `v` and `t`, the triangle inequality
+    gives two lower bounds on the cost of going from `v` to `t`:
+    `d(L, t) - d(L, v)` and `d(v, L) - d(t, L)`. The largest bound over
+    all landmarks is an admissible and consistent heuristic.
+
+    As in DistanceField, every cell is weighted at least 1, so moving the
+    start (whose weight drops to 0) keeps the table valid.
+    """
+
+    def __init__(self, grid: Grid, count: int) -> None:
+        # Shared with the grid, read when cells change
+        self.walls = grid.walls
+        self.costs = grid.costs
+
+        # Cell weights the table was built with, 0 for walls
+        self.weights = array("H", (
+            0 if wall else max(cost, 1)
+            for wall, cost in zip(grid.walls, grid.costs)
+        ))
+
+        # Costs from (forward) and to (backward) every landmark
+        self.landmarks: list[int] = []
+        self.forward: list[array] = []
+        self.backward: list[array] = []
+
+        # Set when an edit changes a weight or wall, the table is rebuilt
+        # on next use
+        self.stale = False
+
+        self._build(grid, count)
+
+    def mark_stale(self, idx: int) -> None:
+        """Invalidate the table if a changed cell affects it
+
+        Args:
+            idx (int): Index of the changed cell
+        """
+        weight = 0 if self.walls[idx] else max(self.costs[idx], 1)
+        self.stale |= weight != self.weights[idx]
+
+    def heuristic(
+        self,
+        grid: Grid,
+        end: tuple[int, int] | None = None
+    ) -> Callable[[int], int]:
+        """Get the landmark heuristic towards the end of a grid
+
+        Args:
+            grid (Grid): Grid of points
+            end (tuple[int, int] | None, optional): Cell to head for.
+            Defaults to the grid's end.
+
+        Returns:
+            Callable[[int], int]: Lower bound on the cost from a cell
+            index to the end
+        """
+        goal_row, goal_col = grid.end if end is None else end
+        end = grid.index((goal_row, goal_col))
+        width = grid.width
+
+        # Landmarks in the same region as the end
+        tables = [
+            (forward, backward, forward[end], backward[end])
+            for forward, backward in zip(self.forward, self.backward)
+            if forward[end] != INFINITY
+        ]
+
+        def heuristic(idx: int) -> int:
+            row, col = divmod(idx, width)
+            best = abs(row - goal_row) + abs(col - goal_col)
+
+            for forward, backward, to_end, from_end in tables:
+                if forward[idx] == INFINITY:
+                    continue
+
+                best = max(best, to_end - forward[idx],
+                           backward[idx] - from_end)
+
+            return best
+
+        return heuristic
+
+    def _build(self, grid: Grid, count: int) -> None:
+        """Pick landmarks by farthest-point selection and fill the tables
+
+        The first landmark is the cell farthest from the start; every
+        next one is the cell farthest from all landmarks chosen so far.
+
+        Args:
+            grid (Grid): Grid of points
+            count (int): Number of landmarks
+        """
+        # Cheapest cost from any landmark so far, seeded from the start
+        nearest = DijkstrasSearch.distances(
+            grid, grid.index(grid.start), costs=self.weights
+        )
+
+        for _ in range(count):
+            landmark, farthest = -1, 0
+            for idx, cost in enumerate(nearest):
+                if cost != INFINITY and cost > farthest:
+                    landmark, farthest = idx, cost
+
+            # Every reachable cell already is a landmark
+            if landmark == -1:
+                break
+
+            forward = DijkstrasSearch.distances(
+                grid, landmark, costs=self.weights
+            )
+            backward = DijkstrasSearch.distances(
+                grid, landmark, reverse=True, costs=self.weights
+            )
+
+            self.landmarks.append(landmark)
+            self.forward.append(forward)
+            self.backward.append(backward)
+
+            nearest = array("I", map(min, nearest, forward))
+
+
+class ALTSearch:
+    # Number of landmarks per grid
+    LANDMARKS = 4
+
+    # Cached landmark table of every grid searched so far
+    tables: "WeakKeyDictionary[Grid, LandmarkTable]" = WeakKeyDictionary()
+
+    @staticmethod
+    def search(grid: Grid) -> Solution:
+        """Find path between two points in a grid using A* Search with
+        landmark (ALT) heuristics
+
+        Landmark tables are built once per grid and rebuilt after a wall
+        or weight changes. The time spent building them is included in the
+        solution time and reported separately as `preprocessing_time`.
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            Solution: Solution found
+        """
+        start_time = time.perf_counter()
+        table = ALTSearch.table(grid)
+        preprocessing_time = (time.perf_counter() - start_time) * 1000
+
+        solution = AStarSearch.search(grid, table.heuristic(grid))
+        solution.preprocessing_time = preprocessing_time
+
+        return solution
+
+    @staticmethod
+    def table(grid: Grid) -> LandmarkTable:
+        """Get the cached landmark table of a grid, rebuilding it if the
+        grid changed
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            LandmarkTable: Up to date landmark table
+        """
+        table = ALTSearch.tables.get(grid)
+
+        if table is None or table.stale:
+            if table is not None:
+                grid.listeners.remove(table.mark_stale)
+
+            table = LandmarkTable(grid, ALTSearch.LANDMARKS)
+            grid.listeners.append(table.mark_stale)
+            ALTSearch.tables[grid] = table
+
+        return table
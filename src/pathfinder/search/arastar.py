@@ -0,0 +1,289 @@
+import math
+import time
+from array import array
+from itertools import chain
+from weakref import WeakKeyDictionary
+
+from ..models.closed_set import ClosedSet
+from ..models.frontier import PriorityQueueFrontier
+from ..models.grid import INFINITY, Grid
+from ..models.solution import NoSolution, Solution
+
+# Expansions between two reads of the clock
+CHUNK = 64
+
+
+class ARAStarPlanner:
+    """Model an ARA* (Anytime Repairing A*) search kept alive between
+    queries on one grid
+
+    Weighted A* with the heuristic inflated by `epsilon` finds a path at
+    most `epsilon` times as expensive as the cheapest one, expanding far
+    fewer cells than A*. Every time a path is found, `epsilon` is
+    lowered and the search goes on from the costs it already has: only
+    cells whose cost dropped since they were expanded are expanded
+    again, until `epsilon` reaches 1 and the path is the cheapest.
+    """
+
+    def __init__(self, grid: Grid, epsilon: float, step: float) -> None:
+        size = grid.width * grid.height
+        self.width = grid.width
+        self.start = grid.index(grid.start)
+        self.end = grid.index(grid.end)
+
+        # Inflation of the heuristic and how much it drops every path
+        self.epsilon = epsilon
+        self.step = step
+
+        # Any edit makes the planner stale, so these stay valid
+        self.offsets, self.targets, _ = grid.adjacency()
+        self.costs = grid.costs
+
+        # Edit counter of the grid the search is valid for
+        self.version = grid.version
+
+        self.g = array("I", [INFINITY]) * size
+        self.parents = array("i", [-1]) * size
+        self.g[self.start] = 0
+
+        # Cells expanded with the current epsilon and expanded cells
+        # whose cost dropped since, left for the next epsilon
+        self.closed = bytearray(size)
+        self.incons: set[int] = set()
+
+        self.frontier = PriorityQueueFrontier()
+        self.frontier.add(self.start, priority=self.key(self.start))
+
+        # Best path so far (cell indices), its cost and how many times
+        # the cheapest cost it may be
+        self.path: list[int] | None = None
+        self.cost = INFINITY
+        self.bound = math.inf
+
+        # Set once the path cannot improve, or there is none
+        self.done = False
+
+    def heuristic(self, idx: int) -> int:
+        """Get the Manhattan distance from a cell to the end
+
+        Args:
+            idx (int): Cell index
+
+        Returns:
+            int: Distance
+        """
+        row, col = divmod(idx, self.width)
+        end_row, end_col = divmod(self.end, self.width)
+
+        return abs(row - end_row) + abs(col - end_col)
+
+    def key(self, idx: int) -> tuple[float, int]:
+        """Get the frontier priority of a cell
+
+        Args:
+            idx (int): Cell index
+
+        Returns:
+            tuple[float, int]: Priority
+        """
+        h = self.heuristic(idx)
+        return (self.g[idx] + self.epsilon * h, h)
+
+    def run(self, explored: ClosedSet, deadline: float | None) -> None:
+        """Find a path, then improve it until it is the cheapest or the
+        deadline passes
+
+        Args:
+            explored (ClosedSet): Records expanded cells
+            deadline (float | None): `time.perf_counter()` value to stop
+            at once there is a path, None to run until done
+        """
+        while not self.done:
+            if not self._improve(explored, deadline if self.path else None):
+                return
+
+            self._publish()
+            if self.done:
+                return
+
+            # Lowered even if time is up, for the next call to go on with
+            self._tighten()
+
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+
+    def _improve(self, explored: ClosedSet, deadline: float | None) -> bool:
+        """Expand cells until no path to the end can beat the current one
+        by more than epsilon
+
+        Args:
+            explored (ClosedSet): Records expanded cells
+            deadline (float | None): `time.perf_counter()` value to stop
+            at, None for no limit
+
+        Returns:
+            bool: Whether it finished before the deadline
+        """
+        frontier = self.frontier
+        g, parents, closed = self.g, self.parents, self.closed
+        offsets, targets, costs = self.offsets, self.targets, self.costs
+        end = self.end
+        count = 0
+
+        while not frontier.is_empty() and g[end] > frontier.peek()[0][0]:
+            # Check the clock every few expansions, not after each one
+            count += 1
+            if deadline is not None and count % CHUNK == 0 \
+                    and time.perf_counter() >= deadline:
+                return False
+
+            node = frontier.pop()
+            closed[node] = 1
+            explored.add(node)
+
+            for k in range(offsets[node], offsets[node + 1]):
+                state = targets[k]
+                cost = g[node] + costs[state]
+
+                if cost < g[state]:
+                    g[state] = cost
+                    parents[state] = node
+
+                    # Expanded cells wait for the next epsilon
+                    if closed[state]:
+                        self.incons.add(state)
+                    else:
+                        frontier.add(state, priority=self.key(state))
+
+        return True
+
+    def _publish(self) -> None:
+        """Keep the path found with the current epsilon and work out its
+        bound
+        """
+        if self.g[self.end] == INFINITY:
+            self.path = None
+            self.done = True
+            return
+
+        path = [self.end]
+        while path[-1] != self.start:
+            path.append(self.parents[path[-1]])
+
+        path.reverse()
+
+        self.path = path
+        self.cost = sum(self.costs[idx] for idx in path[1:])
+
+        # Any cheaper path leaves through a queued or inconsistent cell,
+        # so the lowest g + h among them bounds the cheapest cost
+        lower = min(
+            (self.g[idx] + self.heuristic(idx)
+             for idx in chain(self.frontier.positions, self.incons)),
+            default=self.cost
+        )
+
+        if lower >= self.cost:
+            self.bound = 1.0
+        else:
+            self.bound = min(self.epsilon, self.cost / lower)
+
+        self.done = self.bound <= 1
+
+    def _tighten(self) -> None:
+        """Lower epsilon and queue the inconsistent cells again
+        """
+        self.epsilon = max(1.0, self.epsilon - self.step)
+
+        # Every priority changes with epsilon
+        queued = set(self.frontier.positions) | self.incons
+        self.incons.clear()
+        self.closed = bytearray(len(self.closed))
+
+        self.frontier = PriorityQueueFrontier()
+        for idx in queued:
+            self.frontier.add(idx, priority=self.key(idx))
+
+
+class ARAStarSearch:
+    # Planner of every grid searched so far
+    planners: "WeakKeyDictionary[Grid, ARAStarPlanner]" = \
+        WeakKeyDictionary()
+
+    # Inflation of the heuristic for the first path, lowered by STEP
+    # after every path
+    EPSILON = 3.0
+    STEP = 0.5
+
+    @staticmethod
+    def search(grid: Grid, deadline: float | None = None) -> Solution:
+        """Find path between two points in a grid using ARA* (Anytime
+        Repairing A*)
+
+        A path at most EPSILON times as expensive as the cheapest one is
+        found first, then improved while time allows. The search state
+        is kept between calls, so a call that runs out of time is picked
+        up by the next one until the path is the cheapest, the start or
+        end moves, or a cell is edited. The explored cells are the ones
+        expanded by this call.
+
+        Args:
+            grid (Grid): Grid of points
+            deadline (float | None, optional): Milliseconds to spend
+            improving the path. The first path is found however long it
+            takes. Defaults to no limit, which returns the cheapest path.
+
+        Returns:
+            Solution: Best solution found so far, its `bound` says how
+            many times the cheapest path cost it may be
+        """
+        end_time = None
+        if deadline is not None:
+            end_time = time.perf_counter() + deadline / 1000
+
+        explored = ClosedSet(grid.width * grid.height)
+
+        if grid.start == grid.end:
+            explored.add(grid.index(grid.start))
+            return Solution(
+                [grid.start], explored.positions(grid.width), bound=1.0
+            )
+
+        planner = ARAStarSearch.planner(grid)
+        planner.run(explored, end_time)
+
+        # Return empty Solution object for no solution
+        if planner.path is None:
+            return NoSolution([], explored.positions(grid.width))
+
+        return Solution(
+            [grid.position(idx) for idx in planner.path],
+            explored.positions(grid.width),
+            path_cost=planner.cost,
+            bound=planner.bound
+        )
+
+    @staticmethod
+    def planner(grid: Grid) -> ARAStarPlanner:
+        """Get the planner of a grid, starting over if an endpoint moved
+        or a cell changed since the last query
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            ARAStarPlanner: Planner ready for the query
+        """
+        planner = ARAStarSearch.planners.get(grid)
+
+        if planner is not None and planner.version == grid.version \
+                and planner.start == grid.index(grid.start) \
+                and planner.end == grid.index(grid.end):
+            return planner
+
+        planner = ARAStarPlanner(
+            grid, ARAStarSearch.EPSILON, ARAStarSearch.STEP
+        )
+        ARAStarSearch.planners[grid] = planner
+
+        return planner
@@ -1,85 +1,137 @@
+from array import array
+from typing import Callable
+
+from ..models.closed_set import ClosedSet
 from ..models.frontier import PriorityQueueFrontier
-from ..models.grid import Grid
+from ..models.grid import INFINITY, Grid
 from ..models.solution import NoSolution, Solution
+from ..models.stream import SolutionStream, drain
 
 
 class AStarSearch:
     @staticmethod
-    def search(grid: Grid) -> Solution:
+    def search(
+        grid: Grid,
+        heuristic: Callable[[int], int] | None = None,
+        costs: array | None = None,
+        starts: list[tuple[int, int]] | None = None,
+        ends: list[tuple[int, int]] | None = None
+    ) -> Solution:
         """Find path between two points in a grid using A* Search
 
         Args:
             grid (Grid): Grid of points
-            callback (Optional[Visualiser], optional): Callback for 
-            visualisation. Defaults to None.
+            heuristic (Callable[[int], int] | None, optional): Estimated
+            cost from a cell index to the end. Must be consistent.
+            Defaults to Manhattan distance to the nearest end.
+            costs (array | None, optional): Cell weights to use instead
+            of the grid's. Defaults to None.
+            starts (list[tuple[int, int]] | None, optional): Cells to
+            search from at once. Defaults to the grid's start.
+            ends (list[tuple[int, int]] | None, optional): Stop at the
+            first of these reached. Defaults to the grid's end.
 
         Returns:
             Solution: Solution found
         """
-        # Create Node for the source cell
-        node = grid.get_node(pos=grid.start)
-
-        # Instantiate PriorityQueue frontier and add node into it
-        frontier = PriorityQueueFrontier()
-        frontier.add(
-            node,
-            priority=AStarSearch.heuristic(grid.start, grid.end)
+        return drain(
+            AStarSearch.stream(grid, heuristic, costs, starts, ends)
         )
 
-        # Keep track of G scores
-        g_score = {grid.start: 0}
-        f_score = {grid.start: AStarSearch.heuristic(grid.start, grid.end)}
+    @staticmethod
+    def stream(
+        grid: Grid,
+        heuristic: Callable[[int], int] | None = None,
+        costs: array | None = None,
+        starts: list[tuple[int, int]] | None = None,
+        ends: list[tuple[int, int]] | None = None
+    ) -> SolutionStream:
+        """Run A* Search one expansion at a time
+
+        Args:
+            grid (Grid): Grid of points
+            heuristic (Callable[[int], int] | None, optional): Estimated
+            cost from a cell index to the end. Must be consistent.
+            Defaults to Manhattan distance to the nearest end.
+            costs (array | None, optional): Cell weights to use instead
+            of the grid's. Defaults to None.
+            starts (list[tuple[int, int]] | None, optional): Cells to
+            search from at once. Defaults to the grid's start.
+            ends (list[tuple[int, int]] | None, optional): Stop at the
+            first of these reached. Defaults to the grid's end.
+
+        Yields:
+            int: Index of every explored cell, in order
+
+        Returns:
+            Solution: Solution found
+        """
+        ends = ends or [grid.end]
+        goals = {grid.index(end) for end in ends}
+        size = grid.width * grid.height
+
+        if heuristic is None:
+            # Paths that do not begin on the start marker may cross it,
+            # and it weighs 0
+            crossable = starts and grid.start not in starts \
+                and grid.get_cost(grid.start) == 0
+            heuristic = AStarSearch.nearest(grid, ends, 1 if crossable else 0)
+
+        # Per-query bookkeeping; the grid itself is never modified
+        parents = array("i", [-1]) * size
+        g_score = array("I", [INFINITY]) * size
+
+        # Instantiate PriorityQueue frontier and add the source cells into it
+        frontier = PriorityQueueFrontier()
+        for start in starts or [grid.start]:
+            source = grid.index(start)
+            h = heuristic(source)
+            frontier.add(source, priority=(h, h))
+            g_score[source] = 0
 
         # Keep track of explored nodes
-        explored = []
+        explored = ClosedSet(size)
+
+        # Precomputed neighbour index
+        offsets, targets, _ = grid.adjacency()
+        if costs is None:
+            costs = grid.costs
 
         while True:
             # Return empty Solution object for no solution
             if frontier.is_empty():
-                return NoSolution([], explored)
+                return NoSolution([], explored.positions(grid.width))
 
             # Remove node from the frontier
             node = frontier.pop()
-            if node.state not in explored:
-                explored.append(node.state)
+            if explored.add(node):
+                yield node
 
             # If reached destination point
-            if node.state == grid.end:
+            if node in goals:
 
                 # Generate path and return a Solution object
-                cells = []
-                path_cost = 0
-
-                temp = node
-                while temp.parent != None:
-                    cells.append(temp.state)
-                    path_cost += temp.cost
-                    temp = temp.parent
-
-                cells.append(grid.start)
-                cells.reverse()
+                cells, path_cost = grid.get_path(parents, node)
 
-                return Solution(cells, explored, path_cost=path_cost)
+                return Solution(
+                    cells,
+                    explored.positions(grid.width),
+                    path_cost=path_cost
+                )
 
             # Determine possible actions
-            for action, state in grid.get_neighbours(node.state).items():
-                cost = g_score[node.state] + grid.get_cost(state)
+            for k in range(offsets[node], offsets[node + 1]):
+                state = targets[k]
+                cost = g_score[node] + costs[state]
 
-                if state not in g_score or cost < g_score[state]:
+                if cost < g_score[state]:
                     g_score[state] = cost
-                    f_score[state] = cost + \
-                        AStarSearch.heuristic(state, grid.end)
-
-                    n = grid.get_node(pos=state)
-                    n.parent = node
-                    n.estimated_distance = f_score[state] - cost
-
-                    if not n.action:
-                        n.action = action
+                    parents[state] = node
 
+                    h = heuristic(state)
                     frontier.add(
-                        node=n,
-                        priority=f_score[state]
+                        node=state,
+                        priority=(cost + h, h)
                     )
 
     @staticmethod
@@ -97,3 +149,40 @@ class AStarSearch:
         x2, y2 = goal
 
         return abs(x1 - x2) + abs(y1 - y2)
+
+    @staticmethod
+    def nearest(
+        grid: Grid,
+        ends: list[tuple[int, int]],
+        slack: int = 0
+    ) -> Callable[[int], int]:
+        """Get the Manhattan distance from a cell index to the nearest of
+        several cells
+
+        The minimum of admissible estimates is admissible, so this can
+        guide a search that may stop at any of the cells.
+
+        Args:
+            grid (Grid): Grid of points
+            ends (list[tuple[int, int]]): Target cells
+            slack (int, optional): Amount to lower every estimate by, for
+            paths that may cross cells of weight 0. Defaults to 0.
+
+        Returns:
+            Callable[[int], int]: Heuristic over cell indices
+        """
+        width = grid.width
+
+        if len(ends) == 1 and not slack:
+            (goal_row, goal_col), = ends
+
+            def heuristic(idx: int) -> int:
+                row, col = divmod(idx, width)
+                return abs(row - goal_row) + abs(col - goal_col)
+        else:
+            def heuristic(idx: int) -> int:
+                row, col = divmod(idx, width)
+                return max(min(abs(row - goal_row) + abs(col - goal_col)
+                               for goal_row, goal_col in ends) - slack, 0)
+
+        return heuristic
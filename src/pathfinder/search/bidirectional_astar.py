@@ -0,0 +1,117 @@
+from array import array
+
+from .astar import AStarSearch
+from .bidirectional_bfs import BidirectionalBreadthFirstSearch
+from ..models.closed_set import ClosedSet
+from ..models.frontier import PriorityQueueFrontier
+from ..models.grid import INFINITY, Grid
+from ..models.solution import NoSolution, Solution
+
+
+class BidirectionalAStarSearch:
+    @staticmethod
+    def search(grid: Grid) -> Solution:
+        """Find path between two points in a grid using A* Search from
+        both ends at once
+
+        The forward search scores a cell by the cost of reaching it from
+        the start; the backward search by the cost of the rest of the path
+        from it to the end, which excludes the cell's own weight. So a cell
+        reached by both gives a path of cost `g_forward + g_backward`. The
+        search stops once the best such cost is no larger than the lowest
+        f-score of either frontier. With a consistent heuristic, no path
+        found later can be cheaper.
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            Solution: Solution found
+        """
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+        size = grid.width * grid.height
+
+        # Keep track of explored positions (both directions)
+        explored = ClosedSet(size)
+
+        if start == end:
+            explored.add(start)
+            return Solution([grid.start], explored.positions(grid.width))
+
+        # One frontier, parent array and g-score array per direction.
+        # Backward parents point one step closer to the end.
+        frontiers = (PriorityQueueFrontier(), PriorityQueueFrontier())
+        parents = (array("i", [-1]) * size, array("i", [-1]) * size)
+        g_scores = (array("I", [INFINITY]) * size,
+                    array("I", [INFINITY]) * size)
+        goals = (grid.end, grid.start)
+
+        h = AStarSearch.heuristic(grid.start, grid.end)
+        frontiers[0].add(start, priority=(h, h))
+        frontiers[1].add(end, priority=(h, h))
+        g_scores[0][start] = 0
+        g_scores[1][end] = 0
+
+        # Best meeting cell found so far
+        best = INFINITY
+        meet = -1
+
+        # Precomputed neighbour index
+        offsets, targets, _ = grid.adjacency()
+        costs = grid.costs
+
+        while not frontiers[0].is_empty() and not frontiers[1].is_empty():
+            top = (frontiers[0].peek()[0][0], frontiers[1].peek()[0][0])
+
+            # Neither direction can improve on the best path any more
+            if max(top) >= best:
+                break
+
+            # Expand from the smaller frontier
+            side = 0 if len(frontiers[0].frontier) <= \
+                len(frontiers[1].frontier) else 1
+            frontier = frontiers[side]
+            own, other = g_scores[side], g_scores[1 - side]
+
+            node = frontier.pop()
+            explored.add(node)
+
+            # Paths through the start cell are never useful backwards
+            if side == 1 and node == start:
+                continue
+
+            for k in range(offsets[node], offsets[node + 1]):
+                state = targets[k]
+
+                # Forward moves pay for the cell entered, backward moves
+                # for the cell left
+                cost = own[node] + costs[state if side == 0 else node]
+
+                if cost < own[state]:
+                    own[state] = cost
+                    parents[side][state] = node
+
+                    h = AStarSearch.heuristic(
+                        grid.position(state), goals[side]
+                    )
+                    frontier.add(node=state, priority=(cost + h, h))
+
+                    if other[state] != INFINITY \
+                            and cost + other[state] < best:
+                        best = cost + other[state]
+                        meet = state
+
+        # Return empty Solution object for no solution
+        if meet == -1:
+            return NoSolution([], explored.positions(grid.width))
+
+        cells, path_cost = BidirectionalBreadthFirstSearch.join_paths(
+            grid, parents, meet
+        )
+
+        return Solution(
+            cells,
+            explored.positions(grid.width),
+            path_cost=path_cost
+        )
@@ -0,0 +1,116 @@
+from array import array
+
+from ..models.closed_set import ClosedSet
+from ..models.frontier import QueueFrontier
+from ..models.grid import INFINITY, Grid
+from ..models.solution import NoSolution, Solution
+
+
+class BidirectionalBreadthFirstSearch:
+    @staticmethod
+    def search(grid: Grid) -> Solution:
+        """Find path between two points in a grid using Breadth First
+        Search from both ends at once
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            Solution: Solution found
+        """
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+        size = grid.width * grid.height
+
+        # Keep track of explored positions (both directions)
+        explored = ClosedSet(size)
+
+        if start == end:
+            explored.add(start)
+            return Solution([grid.start], explored.positions(grid.width))
+
+        # One frontier, parent array and depth array per direction.
+        # Backward parents point one step closer to the end.
+        frontiers = (QueueFrontier(), QueueFrontier())
+        parents = (array("i", [-1]) * size, array("i", [-1]) * size)
+        depths = (array("I", [INFINITY]) * size,
+                  array("I", [INFINITY]) * size)
+
+        frontiers[0].add(start)
+        frontiers[1].add(end)
+        depths[0][start] = 0
+        depths[1][end] = 0
+
+        # Precomputed neighbour index
+        offsets, targets, _ = grid.adjacency()
+
+        while True:
+            # Return empty Solution object for no solution
+            if frontiers[0].is_empty() or frontiers[1].is_empty():
+                return NoSolution([], explored.positions(grid.width))
+
+            # Expand one whole layer of the smaller frontier
+            side = 0 if len(frontiers[0].frontier) <= \
+                len(frontiers[1].frontier) else 1
+            frontier = frontiers[side]
+            own, other = depths[side], depths[1 - side]
+
+            best = INFINITY
+            meet = -1
+
+            for _ in range(len(frontier.frontier)):
+                node = frontier.remove()
+                explored.add(node)
+
+                for k in range(offsets[node], offsets[node + 1]):
+                    state = targets[k]
+
+                    if own[state] != INFINITY:
+                        continue
+
+                    own[state] = own[node] + 1
+                    parents[side][state] = node
+                    frontier.add(node=state)
+
+                    # Both searches reached this cell
+                    if other[state] != INFINITY \
+                            and own[state] + other[state] < best:
+                        best = own[state] + other[state]
+                        meet = state
+
+            # The shortest meeting point is known once the layer is done
+            if meet != -1:
+                cells, path_cost = BidirectionalBreadthFirstSearch \
+                    .join_paths(grid, parents, meet)
+
+                return Solution(
+                    cells,
+                    explored.positions(grid.width),
+                    path_cost=path_cost
+                )
+
+    @staticmethod
+    def join_paths(
+        grid: Grid,
+        parents: tuple[array, array],
+        meet: int
+    ) -> tuple[list[tuple[int, int]], int]:
+        """Join the forward and backward halves of a path at a cell
+
+        Args:
+            grid (Grid): Grid of points
+            parents (tuple[array, array]): Forward and backward parents
+            meet (int): Index of the cell where the searches met
+
+        Returns:
+            tuple[list[tuple[int, int]], int]: Path and its cost
+        """
+        cells, path_cost = grid.get_path(parents[0], meet)
+
+        idx = parents[1][meet]
+        while idx != -1:
+            cells.append(grid.position(idx))
+            path_cost += grid.costs[idx]
+            idx = parents[1][idx]
+
+        return cells, path_cost
@@ -1,6 +1,10 @@
+from array import array
+
+from ..models.closed_set import ClosedSet
 from ..models.grid import Grid
 from ..models.frontier import StackFrontier
 from ..models.solution import NoSolution, Solution
+from ..models.stream import SolutionStream, drain
 
 
 class DepthFirstSearch:
@@ -16,54 +20,68 @@ class DepthFirstSearch:
         Returns:
             Solution: Solution found
         """
-        # Create Node for the source cell
-        node = grid.get_node(pos=grid.start)
+        return drain(DepthFirstSearch.stream(grid))
+
+    @staticmethod
+    def stream(grid: Grid) -> SolutionStream:
+        """Run Depth First Search one expansion at a time
+
+        Args:
+            grid (Grid): Grid of points
+
+        Yields:
+            int: Index of every explored cell, in order
+
+        Returns:
+            Solution: Solution found
+        """
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+        size = grid.width * grid.height
 
-        # Instantiate Frontier and add node into it
+        # Instantiate Frontier and add the source cell into it
         frontier = StackFrontier()
-        frontier.add(node)
+        frontier.add(start)
+
+        # Per-query bookkeeping; the grid itself is never modified
+        parents = array("i", [-1]) * size
 
         # Keep track of explored positions
-        explored_states = {}
+        explored = ClosedSet(size)
+
+        # Precomputed neighbour index
+        offsets, targets, _ = grid.adjacency()
 
         while True:
             # Return empty Solution object for no solution
             if frontier.is_empty():
-                return NoSolution([], list(explored_states))
+                return NoSolution([], explored.positions(grid.width))
 
             # Remove node from the frontier
             node = frontier.remove()
 
             # Add current node position the explored set
-            explored_states[node.state] = True
+            if explored.add(node):
+                yield node
 
             # If reached destination point
-            if node.state == grid.end:
+            if node == end:
 
                 # Generate path and return a Solution object
-                cells = []
-
-                path_cost = 0
-
-                temp = node
-                while temp.parent != None:
-                    cells.append(temp.state)
-                    path_cost += temp.cost
-                    temp = temp.parent
-
-                cells.append(grid.start)
-                cells.reverse()
+                cells, path_cost = grid.get_path(parents, node)
 
                 return Solution(
-                    cells, list(explored_states), path_cost=path_cost)
+                    cells,
+                    explored.positions(grid.width),
+                    path_cost=path_cost
+                )
 
             # Determine possible actions
-            for action, state in grid.get_neighbours(node.state).items():
-                if state in explored_states or frontier.contains_state(state):
-                    continue
+            for k in range(offsets[node], offsets[node + 1]):
+                state = targets[k]
 
-                new = grid.get_node(pos=state)
-                new.parent = node
-                new.action = action
+                if state in explored or frontier.contains_state(state):
+                    continue
 
-                frontier.add(node=new)
+                parents[state] = node
+                frontier.add(node=state)
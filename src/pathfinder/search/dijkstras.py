@@ -1,77 +1,171 @@
-from ..models.frontier import PriorityQueueFrontier
-from ..models.grid import Grid
+from array import array
+
+from ..models.closed_set import ClosedSet
+from ..models.frontier import BucketQueueFrontier
+from ..models.grid import INFINITY, Grid
 from ..models.solution import NoSolution, Solution
+from ..models.stream import SolutionStream, drain
 
 
 class DijkstrasSearch:
     @staticmethod
-    def search(grid: Grid) -> Solution:
+    def search(
+        grid: Grid,
+        starts: list[tuple[int, int]] | None = None,
+        ends: list[tuple[int, int]] | None = None
+    ) -> Solution:
         """Find path between two points in a grid using A* Search
 
         Args:
             grid (Grid): Grid of points
-            callback (Optional[Visualiser], optional): Callback for 
-            visualisation. Defaults to None.
+            starts (list[tuple[int, int]] | None, optional): Cells to
+            search from at once. Defaults to the grid's start.
+            ends (list[tuple[int, int]] | None, optional): Stop at the
+            first of these reached. Defaults to the grid's end.
 
         Returns:
             Solution: Solution found
         """
+        return drain(DijkstrasSearch.stream(grid, starts, ends))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        starts: list[tuple[int, int]] | None = None,
+        ends: list[tuple[int, int]] | None = None
+    ) -> SolutionStream:
+        """Run Dijkstra's Search one expansion at a time
 
-        # Create Node for the source cell
-        node = grid.get_node(pos=grid.start)
+        Args:
+            grid (Grid): Grid of points
+            starts (list[tuple[int, int]] | None, optional): Cells to
+            search from at once. Defaults to the grid's start.
+            ends (list[tuple[int, int]] | None, optional): Stop at the
+            first of these reached. Defaults to the grid's end.
 
-        # Instantiate PriorityQueue frontier and add node into it
-        frontier = PriorityQueueFrontier()
-        frontier.add(node)
+        Yields:
+            int: Index of every explored cell, in order
+
+        Returns:
+            Solution: Solution found
+        """
+        goals = {grid.index(end) for end in ends or [grid.end]}
+        size = grid.width * grid.height
 
-        # Keep track of G scores
-        distance = {grid.start: 0}
+        # Per-query bookkeeping; the grid itself is never modified
+        parents = array("i", [-1]) * size
+        distance = array("I", [INFINITY]) * size
 
-        explored = []
+        # Instantiate bucket queue frontier and add the source cells into
+        # it. No move costs more than the heaviest cell.
+        frontier = BucketQueueFrontier(grid.max_cost())
+        for start in starts or [grid.start]:
+            source = grid.index(start)
+            frontier.add(source)
+            distance[source] = 0
+
+        explored = ClosedSet(size)
+
+        # Precomputed neighbour index
+        offsets, targets, _ = grid.adjacency()
+        costs = grid.costs
 
         while True:
             # Return empty Solution object for no solution
             if frontier.is_empty():
-                return NoSolution([], explored)
+                return NoSolution([], explored.positions(grid.width))
 
             # Remove node from the frontier
             node = frontier.pop()
-            if node.state not in explored:
-                explored.append(node.state)
+            if explored.add(node):
+                yield node
 
             # If reached destination point
-            if node.state == grid.end:
+            if node in goals:
 
                 # Generate path and return a Solution object
-                cells = []
-
-                path_cost = 0
-
-                temp = node
-                while temp.parent != None:
-                    cells.append(temp.state)
-                    path_cost += temp.cost
-                    temp = temp.parent
+                cells, path_cost = grid.get_path(parents, node)
 
-                cells.append(grid.start)
-                cells.reverse()
-
-                return Solution(cells, explored, path_cost=path_cost)
+                return Solution(
+                    cells,
+                    explored.positions(grid.width),
+                    path_cost=path_cost
+                )
 
             # Determine possible actions
-            for action, state in grid.get_neighbours(node.state).items():
-                cost = distance[node.state] + grid.get_cost(state)
+            for k in range(offsets[node], offsets[node + 1]):
+                state = targets[k]
+                cost = distance[node] + costs[state]
 
-                if state not in distance or cost < distance[state]:
+                if cost < distance[state]:
                     distance[state] = cost
-
-                    n = grid.get_node(pos=state)
-                    n.parent = node
-
-                    if not n.action:
-                        n.action = action
+                    parents[state] = node
 
                     frontier.add(
-                        node=n,
+                        node=state,
                         priority=cost
                     )
+
+    @staticmethod
+    def distances(
+        grid: Grid,
+        source: int,
+        reverse: bool = False,
+        costs: array | None = None
+    ) -> array:
+        """Find the cheapest cost between a cell and every other cell
+
+        Args:
+            grid (Grid): Grid of points
+            source (int): Index of the cell to search from
+            reverse (bool, optional): Find costs of reaching the source
+            instead of leaving it. Defaults to False.
+            costs (array | None, optional): Cell weights to use instead
+            of the grid's. Defaults to None.
+
+        Returns:
+            array: Cost of every cell, INFINITY where unreachable
+        """
+        distance = array("I", [INFINITY]) * (grid.width * grid.height)
+        distance[source] = 0
+
+        # Precomputed neighbour index
+        offsets, targets, _ = grid.adjacency()
+        if costs is None:
+            costs = grid.costs
+            slots = grid.max_cost() + 1
+        else:
+            slots = max(costs, default=0) + 1
+
+        # Same bucket queue as BucketQueueFrontier, inlined for the
+        # sweep. An entry is outdated if its cell got a lower cost since.
+        buckets: list[list[int]] = [[] for _ in range(slots)]
+        buckets[0].append(source)
+        queued = 1
+        current = 0
+
+        while queued:
+            bucket = buckets[current % slots]
+
+            while bucket:
+                node = bucket.pop()
+                queued -= 1
+
+                if distance[node] != current:
+                    continue
+
+                for k in range(offsets[node], offsets[node + 1]):
+                    state = targets[k]
+
+                    # Moves pay for the cell entered; backwards that is
+                    # `node`
+                    cost = current + costs[node if reverse else state]
+
+                    if cost < distance[state]:
+                        distance[state] = cost
+                        buckets[cost % slots].append(state)
+                        queued += 1
+
+            current += 1
+
+        return distance
@@ -0,0 +1,285 @@
+from array import array
+from weakref import WeakKeyDictionary
+
+from ..models.closed_set import ClosedSet
+from ..models.frontier import PriorityQueueFrontier
+from ..models.grid import INFINITY, MOVES, Grid
+from ..models.solution import NoSolution, Solution
+
+
+class DStarLitePlanner:
+    """Model a D* Lite search kept alive between queries on one grid
+
+    The search is rooted at one endpoint (the root) and `g` holds the
+    cost of the cheapest path between every settled cell and the root.
+    The other endpoint (the tip) only steers the order of expansion, so
+    moving it, or editing cells, leaves most of `g` valid and only the
+    affected cells are repaired on the next query.
+    """
+
+    def __init__(self, grid: Grid, root_is_goal: bool) -> None:
+        size = grid.width * grid.height
+        self.width = grid.width
+        self.height = grid.height
+
+        # Search from the end backwards, or from the start forwards
+        self.root_is_goal = root_is_goal
+        self.root = grid.index(grid.end if root_is_goal else grid.start)
+        self.tip = grid.index(grid.start if root_is_goal else grid.end)
+
+        # Settled costs and one-step lookahead costs
+        self.g = array("I", [INFINITY]) * size
+        self.rhs = array("I", [INFINITY]) * size
+        self.rhs[self.root] = 0
+
+        # Heuristic offset accumulated by moving the tip
+        self.km = 0
+
+        self.frontier = PriorityQueueFrontier()
+        self.frontier.add(self.root, priority=self.key(self.root))
+
+        # Cells edited since the last query
+        self.changed: set[int] = set()
+
+    def mark_changed(self, idx: int) -> None:
+        """Remember a changed cell until the next query
+
+        Args:
+            idx (int): Index of the changed cell
+        """
+        self.changed.add(idx)
+
+    def key(self, idx: int) -> tuple[int, int]:
+        """Get the frontier priority of a cell
+
+        Args:
+            idx (int): Cell index
+
+        Returns:
+            tuple[int, int]: Priority
+        """
+        cost = min(self.g[idx], self.rhs[idx])
+        row, col = divmod(idx, self.width)
+        tip_row, tip_col = divmod(self.tip, self.width)
+
+        return (cost + abs(row - tip_row) + abs(col - tip_col) + self.km,
+                cost)
+
+    def neighbours(self, grid: Grid, idx: int) -> list[int]:
+        """Get the open neighbours of a cell
+
+        Reads the wall flags directly, so wall edits do not force the
+        neighbour index of the whole grid to be rebuilt.
+
+        Args:
+            grid (Grid): Grid of points
+            idx (int): Cell index
+
+        Returns:
+            list[int]: Neighbour indices
+        """
+        walls = grid.walls
+        row, col = divmod(idx, self.width)
+        states = []
+
+        for dr, dc in MOVES:
+            r, c = row + dr, col + dc
+
+            if 0 <= r < self.height and 0 <= c < self.width \
+                    and not walls[r * self.width + c]:
+                states.append(r * self.width + c)
+
+        return states
+
+    def edge_cost(self, grid: Grid, idx: int, state: int) -> int:
+        """Get the cost of the move between a cell and a neighbour
+        closer to the root
+
+        Args:
+            grid (Grid): Grid of points
+            idx (int): Cell index
+            state (int): Neighbour index
+
+        Returns:
+            int: Weight of the cell entered by the move
+        """
+        return grid.costs[state if self.root_is_goal else idx]
+
+    def update_vertex(self, grid: Grid, idx: int) -> None:
+        """Recompute the lookahead cost of a cell and requeue it if it is
+        inconsistent
+
+        Args:
+            grid (Grid): Grid of points
+            idx (int): Cell index
+        """
+        if idx != self.root:
+            best = INFINITY
+
+            if not grid.walls[idx]:
+                for state in self.neighbours(grid, idx):
+                    if self.g[state] != INFINITY:
+                        best = min(
+                            best,
+                            self.g[state] + self.edge_cost(grid, idx, state)
+                        )
+
+            self.rhs[idx] = best
+
+        self.frontier.discard(idx)
+        if self.g[idx] != self.rhs[idx]:
+            self.frontier.add(idx, priority=self.key(idx))
+
+    def plan(self, grid: Grid, explored: ClosedSet) -> list[int] | None:
+        """Repair the search after edits and a moved tip, then extract
+        the path
+
+        Args:
+            grid (Grid): Grid of points
+            explored (ClosedSet): Records the cells repaired by this query
+
+        Returns:
+            list[int] | None: Cell indices from start to end, None if there
+            is no path
+        """
+        tip = grid.index(grid.start if self.root_is_goal else grid.end)
+
+        # Keep the old keys valid as lower bounds for the new tip
+        if tip != self.tip:
+            old_row, old_col = divmod(self.tip, self.width)
+            row, col = divmod(tip, self.width)
+            self.km += abs(row - old_row) + abs(col - old_col)
+            self.tip = tip
+
+        # An edited cell changes its own cost and its neighbours' costs
+        for idx in self.changed:
+            self.update_vertex(grid, idx)
+            for state in self.neighbours(grid, idx):
+                self.update_vertex(grid, state)
+
+        self.changed.clear()
+
+        self._compute(grid, explored)
+
+        if self.g[tip] == INFINITY:
+            return None
+
+        # Walk downhill from the tip to the root
+        path = [tip]
+        while path[-1] != self.root:
+            idx = path[-1]
+            path.append(min(
+                self.neighbours(grid, idx),
+                key=lambda state: self.g[state]
+                + self.edge_cost(grid, idx, state)
+            ))
+
+        return path if self.root_is_goal else path[::-1]
+
+    def _compute(self, grid: Grid, explored: ClosedSet) -> None:
+        """Expand inconsistent cells until the tip's cost is settled
+
+        Args:
+            grid (Grid): Grid of points
+            explored (ClosedSet): Records expanded cells
+        """
+        frontier = self.frontier
+        g, rhs = self.g, self.rhs
+        tip = self.tip
+
+        while not frontier.is_empty() and (
+            frontier.peek()[0] < self.key(tip) or rhs[tip] != g[tip]
+        ):
+            priority, idx = frontier.peek()
+            explored.add(idx)
+
+            # Stale key from before the tip moved
+            if priority < self.key(idx):
+                frontier.update(idx, self.key(idx))
+                continue
+
+            frontier.pop()
+
+            if g[idx] > rhs[idx]:
+                g[idx] = rhs[idx]
+                for state in self.neighbours(grid, idx):
+                    self.update_vertex(grid, state)
+            else:
+                g[idx] = INFINITY
+                self.update_vertex(grid, idx)
+                for state in self.neighbours(grid, idx):
+                    self.update_vertex(grid, state)
+
+
+class DStarLiteSearch:
+    # Planner of every grid searched so far
+    planners: "WeakKeyDictionary[Grid, DStarLitePlanner]" = \
+        WeakKeyDictionary()
+
+    @staticmethod
+    def search(grid: Grid) -> Solution:
+        """Find path between two points in a grid using D* Lite
+
+        The search state is kept between calls. When the start or end is
+        dragged, or cells are edited, only the part of the search that
+        depends on the change is redone. The explored cells are the ones
+        repaired by this call.
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            Solution: Solution found
+        """
+        explored = ClosedSet(grid.width * grid.height)
+
+        if grid.start == grid.end:
+            explored.add(grid.index(grid.start))
+            return Solution([grid.start], explored.positions(grid.width))
+
+        path = DStarLiteSearch.planner(grid).plan(grid, explored)
+
+        # Return empty Solution object for no solution
+        if path is None:
+            return NoSolution([], explored.positions(grid.width))
+
+        return Solution(
+            [grid.position(idx) for idx in path],
+            explored.positions(grid.width),
+            path_cost=sum(grid.costs[idx] for idx in path[1:])
+        )
+
+    @staticmethod
+    def planner(grid: Grid) -> DStarLitePlanner:
+        """Get the planner of a grid, rooted at an endpoint that has not
+        moved since the last query
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            DStarLitePlanner: Planner ready for the query
+        """
+        planner = DStarLiteSearch.planners.get(grid)
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+
+        if planner is not None:
+            root = end if planner.root_is_goal else start
+            if root == planner.root:
+                return planner
+
+            grid.listeners.remove(planner.mark_changed)
+
+            # Re-root at the endpoint that stayed put, so that dragging
+            # the other one again is incremental
+            tip = start if planner.root_is_goal else end
+            root_is_goal = planner.root_is_goal != (tip == planner.tip)
+        else:
+            root_is_goal = True
+
+        planner = DStarLitePlanner(grid, root_is_goal)
+        grid.listeners.append(planner.mark_changed)
+        DStarLiteSearch.planners[grid] = planner
+
+        return planner
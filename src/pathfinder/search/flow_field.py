@@ -0,0 +1,167 @@
+from array import array
+from weakref import WeakKeyDictionary
+
+from .dijkstras import DijkstrasSearch
+from ..models.grid import INFINITY, MOVES, Grid
+from ..models.solution import NoSolution, Solution
+
+
+class DistanceField:
+    """Model the cost of reaching the end of a grid from every cell
+
+    The start marker has weight 0 only because the path begins there, so
+    every cell is weighted at least 1 here. That way moving the start
+    does not invalidate the field and a path from any cell is found by
+    walking downhill, in time proportional to its length.
+    """
+
+    def __init__(self, grid: Grid) -> None:
+        self.width = grid.width
+        self.height = grid.height
+        self.end = grid.index(grid.end)
+
+        # Shared with the grid, read when cells change
+        self.walls = grid.walls
+        self.costs = grid.costs
+
+        # Cell weights the field was computed with
+        self.weights = array("H", (max(cost, 1) for cost in grid.costs))
+
+        # Cost from every cell to the end, INFINITY where unreachable
+        self.distance = DijkstrasSearch.distances(
+            grid, self.end, reverse=True, costs=self.weights
+        )
+
+        # Set when an edit changes the field, rebuilt on next use
+        self.stale = False
+
+    def mark_changed(self, idx: int) -> None:
+        """Invalidate the field if a changed cell affects it
+
+        Args:
+            idx (int): Index of the changed cell
+        """
+        if self.walls[idx]:
+            # Blocking an unreachable cell changes nothing
+            self.stale |= self.distance[idx] != INFINITY
+        elif self.distance[idx] == INFINITY:
+            # Opened wall, which may join two regions
+            self.stale = True
+        else:
+            self.stale |= max(self.costs[idx], 1) != self.weights[idx]
+
+    def path(self, start: int) -> list[int] | None:
+        """Follow the field downhill from a cell to the end
+
+        Args:
+            start (int): Index of the first cell
+
+        Returns:
+            list[int] | None: Cell indices of the path, None if the end
+            cannot be reached
+        """
+        distance = self.distance
+        if distance[start] == INFINITY:
+            return None
+
+        path = [start]
+        idx = start
+
+        while idx != self.end:
+            row, col = divmod(idx, self.width)
+            best = INFINITY
+
+            for dr, dc in MOVES:
+                r, c = row + dr, col + dc
+                if not (0 <= r < self.height and 0 <= c < self.width):
+                    continue
+
+                state = r * self.width + c
+                if self.walls[state] or distance[state] == INFINITY:
+                    continue
+
+                if distance[state] + self.weights[state] < best:
+                    best = distance[state] + self.weights[state]
+                    step = state
+
+            idx = step
+            path.append(idx)
+
+        return path
+
+
+class FlowFieldSearch:
+    # Cached distance field of every grid searched so far
+    fields: "WeakKeyDictionary[Grid, DistanceField]" = WeakKeyDictionary()
+
+    @staticmethod
+    def search(grid: Grid) -> Solution:
+        """Find path between two points in a grid by following a
+        distance field rooted at the end
+
+        The field is computed once with Dijkstra's Search from the end
+        and reused until the end moves or an edit changes it. When it is
+        built, every reachable cell is explored (nearest to the end
+        first); afterwards only the path cells are.
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            Solution: Solution found
+        """
+        field = FlowFieldSearch.fields.get(grid)
+        fresh = field is None or field.stale \
+            or field.end != grid.index(grid.end)
+
+        if fresh:
+            field = FlowFieldSearch.field(grid)
+
+        path = field.path(grid.index(grid.start))
+
+        if fresh:
+            explored = sorted(
+                (idx for idx, cost in enumerate(field.distance)
+                 if cost != INFINITY),
+                key=field.distance.__getitem__
+            )
+        else:
+            explored = path or []
+
+        explored = [grid.position(idx) for idx in explored]
+
+        # Return empty Solution object for no solution
+        if path is None:
+            return NoSolution([], explored)
+
+        return Solution(
+            [grid.position(idx) for idx in path],
+            explored,
+            path_cost=sum(grid.costs[idx] for idx in path[1:])
+        )
+
+    @staticmethod
+    def field(grid: Grid) -> DistanceField:
+        """Get the cached distance field of a grid, rebuilding it if the
+        end moved or an edit changed it
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            DistanceField: Up to date distance field
+        """
+        field = FlowFieldSearch.fields.get(grid)
+
+        if field is not None and not field.stale \
+                and field.end == grid.index(grid.end):
+            return field
+
+        if field is not None:
+            grid.listeners.remove(field.mark_changed)
+
+        field = DistanceField(grid)
+        grid.listeners.append(field.mark_changed)
+        FlowFieldSearch.fields[grid] = field
+
+        return field
@@ -1,88 +1,109 @@
+from array import array
+
+from .astar import AStarSearch
+from ..models.closed_set import ClosedSet
 from ..models.frontier import PriorityQueueFrontier
-from ..models.grid import Grid
+from ..models.grid import INFINITY, Grid
 from ..models.solution import NoSolution, Solution
+from ..models.stream import SolutionStream, drain
 
 
 class GreedyBestFirstSearch:
     @staticmethod
-    def search(grid: Grid) -> Solution:
+    def search(
+        grid: Grid,
+        starts: list[tuple[int, int]] | None = None,
+        ends: list[tuple[int, int]] | None = None
+    ) -> Solution:
         """Find path between two points in a grid using A* Search
 
         Args:
             grid (Grid): Grid of points
-            callback (Optional[Visualiser], optional): Callback for 
-            visualisation. Defaults to None.
+            starts (list[tuple[int, int]] | None, optional): Cells to
+            search from at once. Defaults to the grid's start.
+            ends (list[tuple[int, int]] | None, optional): Stop at the
+            first of these reached. Defaults to the grid's end.
 
         Returns:
             Solution: Solution found
         """
-        # Create Node for the source cell
-        node = grid.get_node(pos=grid.start)
+        return drain(GreedyBestFirstSearch.stream(grid, starts, ends))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        starts: list[tuple[int, int]] | None = None,
+        ends: list[tuple[int, int]] | None = None
+    ) -> SolutionStream:
+        """Run Greedy Best First Search one expansion at a time
+
+        Args:
+            grid (Grid): Grid of points
+            starts (list[tuple[int, int]] | None, optional): Cells to
+            search from at once. Defaults to the grid's start.
+            ends (list[tuple[int, int]] | None, optional): Stop at the
+            first of these reached. Defaults to the grid's end.
 
-        # Instantiate PriorityQueue frontier and add node into it
+        Yields:
+            int: Index of every explored cell, in order
+
+        Returns:
+            Solution: Solution found
+        """
+        ends = ends or [grid.end]
+        goals = {grid.index(end) for end in ends}
+        heuristic = AStarSearch.nearest(grid, ends)
+        size = grid.width * grid.height
+
+        # Per-query bookkeeping; the grid itself is never modified
+        parents = array("i", [-1]) * size
+        cost_so_far = array("I", [INFINITY]) * size
+
+        # Instantiate PriorityQueue frontier and add the source cells into it
         frontier = PriorityQueueFrontier()
-        frontier.add(
-            node,
-            priority=GreedyBestFirstSearch.heuristic(grid.start, grid.end)
-        )
+        for start in starts or [grid.start]:
+            source = grid.index(start)
+            frontier.add(source, priority=heuristic(source))
+            cost_so_far[source] = 0
 
-        # Keep track of G scores
-        cost_so_far = {grid.start: 0}
+        explored = ClosedSet(size)
 
-        explored = []
+        # Precomputed neighbour index
+        offsets, targets, _ = grid.adjacency()
+        costs = grid.costs
 
         while True:
             # Return empty Solution object for no solution
             if frontier.is_empty():
-                return NoSolution([], explored)
+                return NoSolution([], explored.positions(grid.width))
 
             # Remove node from the frontier
             node = frontier.pop()
-            if node.state not in explored:
-                explored.append(node.state)
+            if explored.add(node):
+                yield node
 
             # If reached destination point
-            if node.state == grid.end:
+            if node in goals:
 
                 # Generate path and return a Solution object
-                cells = []
-
-                path_cost = 0
-
-                temp = node
-                while temp.parent != None:
-                    cells.append(temp.state)
-                    path_cost += temp.cost
-                    temp = temp.parent
-
-                cells.append(grid.start)
-                cells.reverse()
+                cells, path_cost = grid.get_path(parents, node)
 
-                return Solution(cells, explored, path_cost=path_cost)
+                return Solution(
+                    cells,
+                    explored.positions(grid.width),
+                    path_cost=path_cost
+                )
 
             # Determine possible actions
-            for action, state in grid.get_neighbours(node.state).items():
-                new_cost = cost_so_far[node.state] + grid.get_cost(state)
+            for k in range(offsets[node], offsets[node + 1]):
+                state = targets[k]
+                new_cost = cost_so_far[node] + costs[state]
 
-                if state not in cost_so_far or new_cost < cost_so_far[state]:
+                if new_cost < cost_so_far[state]:
                     cost_so_far[state] = new_cost
+                    parents[state] = node
 
-                    n = grid.get_node(pos=state)
-                    n.parent = node
-                    n.estimated_distance = GreedyBestFirstSearch.heuristic(
-                        state,
-                        grid.end
-                    )
-
-                    if not n.action:
-                        n.action = action
-
-                    frontier.add(
-                        node=n,
-                        priority=GreedyBestFirstSearch.heuristic(
-                            state, grid.end
-                        )
-                    )
+                    frontier.add(node=state, priority=heuristic(state))
 
     @staticmethod
     def heuristic(state: tuple[int, int], goal: tuple[int, int]) -> int:
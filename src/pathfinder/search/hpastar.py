@@ -0,0 +1,442 @@
+from weakref import WeakKeyDictionary
+
+from .astar import AStarSearch
+from ..models.closed_set import ClosedSet
+from ..models.frontier import PriorityQueueFrontier
+from ..models.grid import INFINITY, Grid
+from ..models.solution import NoSolution, Solution
+
+# Entrances at least this long get a transition at both ends
+LONG_ENTRANCE = 6
+
+
+class ClusterAbstraction:
+    """Model the abstract graph of a grid split into square clusters
+
+    Abstract nodes are transition cells on either side of the borders
+    between clusters. Edges join the two cells of a transition and every
+    pair of transition cells that are connected inside their cluster,
+    weighted by the cheapest path between them. Edits only mark their
+    cluster dirty; dirty clusters are rebuilt on the next query.
+    """
+
+    def __init__(self, grid: Grid, cluster_size: int) -> None:
+        self.cluster_size = cluster_size
+        self.columns = -(-grid.width // cluster_size)
+        self.rows = -(-grid.height // cluster_size)
+
+        # (cluster a, cluster b) -> transitions (cell in a, cell in b)
+        self.borders: dict[tuple[int, int], list[tuple[int, int]]] = {}
+
+        # Cluster -> its transition cells
+        self.entrances: dict[int, list[int]] = {}
+
+        # Abstract edges within a cluster and across borders
+        self.intra: dict[int, dict[int, int]] = {}
+        self.inter: dict[int, dict[int, int]] = {}
+
+        # Clusters edited since the last rebuild
+        self.dirty: set[int] = set(range(self.columns * self.rows))
+        self.width = grid.width
+
+    def mark_dirty(self, idx: int) -> None:
+        """Mark the cluster of a changed cell for rebuilding
+
+        Args:
+            idx (int): Index of the changed cell
+        """
+        self.dirty.add(self.cluster_of(idx))
+
+    def cluster_of(self, idx: int) -> int:
+        """Get the cluster of a cell
+
+        Args:
+            idx (int): Cell index
+
+        Returns:
+            int: Cluster id
+        """
+        row, col = divmod(idx, self.width)
+        return (row // self.cluster_size) * self.columns \
+            + col // self.cluster_size
+
+    def refresh(self, grid: Grid) -> None:
+        """Rebuild dirty clusters and the borders around them
+
+        Args:
+            grid (Grid): Grid of points
+        """
+        if not self.dirty:
+            return
+
+        # Clusters whose transition cells have to be reconnected
+        clusters = set(self.dirty)
+
+        for cluster in self.dirty:
+            for border in self._borders_of(cluster):
+                old = self.borders.get(border, [])
+                new = self._find_transitions(grid, border)
+
+                self._set_border(grid, border, old, new)
+                if new != old:
+                    clusters.update(border)
+
+        for cluster in clusters:
+            self._connect(grid, cluster)
+
+        self.dirty.clear()
+
+    def find_path(self, grid: Grid, explored: ClosedSet) -> list[int] | None:
+        """Find an abstract path and refine it into grid cells
+
+        Args:
+            grid (Grid): Grid of points
+            explored (ClosedSet): Records expanded cells
+
+        Returns:
+            list[int] | None: Cell indices of the path, None if there is none
+        """
+        self.refresh(grid)
+
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+
+        # Temporarily connect the start and end to their clusters
+        out, _ = self.search_cluster(grid, start, explored=explored)
+        back, _ = self.search_cluster(
+            grid, end, reverse=True, explored=explored
+        )
+
+        extra: dict[int, dict[int, int]] = {start: {}}
+        for node in self.entrances[self.cluster_of(start)]:
+            if node in out and node != start:
+                extra[start][node] = out[node]
+
+        if end in out:
+            extra[start][end] = out[end]
+
+        for node in self.entrances[self.cluster_of(end)]:
+            if node in back and node != end:
+                extra.setdefault(node, {})[end] = back[node]
+
+        path = self._search_abstract(grid, start, end, extra, explored)
+        if path is None:
+            return None
+
+        # Replace every abstract edge with the cells it stands for
+        cells = [start]
+        for node, state in zip(path, path[1:]):
+            if self.cluster_of(node) != self.cluster_of(state):
+                cells.append(state)
+                continue
+
+            _, parents = self.search_cluster(grid, node, target=state)
+            segment = []
+            while state != node:
+                segment.append(state)
+                state = parents[state]
+
+            cells.extend(reversed(segment))
+
+        return cells
+
+    def search_cluster(
+        self,
+        grid: Grid,
+        source: int,
+        reverse: bool = False,
+        target: int = -1,
+        explored: ClosedSet | None = None
+    ) -> tuple[dict[int, int], dict[int, int]]:
+        """Run Dijkstra's search restricted to the cluster of a cell
+
+        Args:
+            grid (Grid): Grid of points
+            source (int): Index of the cell to search from
+            reverse (bool, optional): Find costs of reaching the source
+            instead of leaving it. Defaults to False.
+            target (int, optional): Stop once this cell is reached.
+            Defaults to -1.
+            explored (ClosedSet | None, optional): Records expanded cells.
+            Defaults to None.
+
+        Returns:
+            tuple[dict[int, int], dict[int, int]]: Costs and parents
+        """
+        cluster = self.cluster_of(source)
+        offsets, targets, _ = grid.adjacency()
+        costs = grid.costs
+
+        distance = {source: 0}
+        parents = {source: -1}
+
+        frontier = PriorityQueueFrontier()
+        frontier.add(source)
+
+        while not frontier.is_empty():
+            node = frontier.pop()
+            if explored is not None:
+                explored.add(node)
+
+            if node == target:
+                break
+
+            for k in range(offsets[node], offsets[node + 1]):
+                state = targets[k]
+                if self.cluster_of(state) != cluster:
+                    continue
+
+                cost = distance[node] + costs[node if reverse else state]
+
+                if cost < distance.get(state, INFINITY):
+                    distance[state] = cost
+                    parents[state] = node
+                    frontier.add(node=state, priority=cost)
+
+        return distance, parents
+
+    def _search_abstract(
+        self,
+        grid: Grid,
+        start: int,
+        end: int,
+        extra: dict[int, dict[int, int]],
+        explored: ClosedSet
+    ) -> list[int] | None:
+        """Run A* over the abstract graph
+
+        Args:
+            grid (Grid): Grid of points
+            start (int): Index of the start cell
+            end (int): Index of the end cell
+            extra (dict[int, dict[int, int]]): Temporary edges
+            explored (ClosedSet): Records expanded nodes
+
+        Returns:
+            list[int] | None: Abstract nodes of the path
+        """
+        h = AStarSearch.heuristic(grid.start, grid.end)
+        frontier = PriorityQueueFrontier()
+        frontier.add(start, priority=(h, h))
+
+        g_score = {start: 0}
+        parents = {start: -1}
+
+        while not frontier.is_empty():
+            node = frontier.pop()
+            explored.add(node)
+
+            if node == end:
+                path = []
+                while node != -1:
+                    path.append(node)
+                    node = parents[node]
+
+                return path[::-1]
+
+            for edges in (self.intra.get(node), self.inter.get(node),
+                          extra.get(node)):
+                if not edges:
+                    continue
+
+                for state, edge_cost in edges.items():
+                    cost = g_score[node] + edge_cost
+
+                    if cost < g_score.get(state, INFINITY):
+                        g_score[state] = cost
+                        parents[state] = node
+
+                        h = AStarSearch.heuristic(
+                            grid.position(state), grid.end
+                        )
+                        frontier.add(node=state, priority=(cost + h, h))
+
+        return None
+
+    def _borders_of(self, cluster: int) -> list[tuple[int, int]]:
+        """Get the borders of a cluster with its neighbours
+
+        Args:
+            cluster (int): Cluster id
+
+        Returns:
+            list[tuple[int, int]]: Cluster pairs, lower id first
+        """
+        row, col = divmod(cluster, self.columns)
+        borders = []
+
+        if col > 0:
+            borders.append((cluster - 1, cluster))
+        if col < self.columns - 1:
+            borders.append((cluster, cluster + 1))
+        if row > 0:
+            borders.append((cluster - self.columns, cluster))
+        if row < self.rows - 1:
+            borders.append((cluster, cluster + self.columns))
+
+        return borders
+
+    def _find_transitions(
+        self,
+        grid: Grid,
+        border: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """Find the transitions across a border
+
+        Args:
+            grid (Grid): Grid of points
+            border (tuple[int, int]): Cluster pair
+
+        Returns:
+            list[tuple[int, int]]: Cell pairs (in first, in second cluster)
+        """
+        size = self.cluster_size
+        row, col = divmod(border[0], self.columns)
+
+        # Cell pairs facing each other along the border
+        if border[1] - border[0] != self.columns:
+            c = (col + 1) * size - 1
+            pairs = [(r * grid.width + c, r * grid.width + c + 1)
+                     for r in range(row * size,
+                                    min((row + 1) * size, grid.height))]
+        else:
+            r = (row + 1) * size - 1
+            pairs = [(r * grid.width + c, (r + 1) * grid.width + c)
+                     for c in range(col * size,
+                                    min((col + 1) * size, grid.width))]
+
+        # Split into entrances (runs of open pairs)
+        transitions = []
+        run: list[tuple[int, int]] = []
+
+        for pair in pairs + [(-1, -1)]:
+            if pair[0] != -1 and not grid.walls[pair[0]] \
+                    and not grid.walls[pair[1]]:
+                run.append(pair)
+                continue
+
+            if len(run) >= LONG_ENTRANCE:
+                transitions.extend((run[0], run[-1]))
+            elif run:
+                transitions.append(run[len(run) // 2])
+
+            run = []
+
+        return transitions
+
+    def _set_border(
+        self,
+        grid: Grid,
+        border: tuple[int, int],
+        old: list[tuple[int, int]],
+        new: list[tuple[int, int]]
+    ) -> None:
+        """Replace the transitions of a border and their edges
+
+        Args:
+            grid (Grid): Grid of points
+            border (tuple[int, int]): Cluster pair
+            old (list[tuple[int, int]]): Previous transitions
+            new (list[tuple[int, int]]): New transitions
+        """
+        for a, b in old:
+            self.inter[a].pop(b, None)
+            self.inter[b].pop(a, None)
+
+        for a, b in new:
+            self.inter.setdefault(a, {})[b] = grid.costs[b]
+            self.inter.setdefault(b, {})[a] = grid.costs[a]
+
+        self.borders[border] = new
+
+    def _connect(self, grid: Grid, cluster: int) -> None:
+        """Recompute the transition cells of a cluster and the costs
+        between them
+
+        Args:
+            grid (Grid): Grid of points
+            cluster (int): Cluster id
+        """
+        for node in self.entrances.get(cluster, []):
+            self.intra.pop(node, None)
+
+        entrances = set()
+        for border in self._borders_of(cluster):
+            side = 0 if border[0] == cluster else 1
+            entrances.update(pair[side]
+                             for pair in self.borders.get(border, []))
+
+        self.entrances[cluster] = sorted(entrances)
+
+        for node in self.entrances[cluster]:
+            distance, _ = self.search_cluster(grid, node)
+            self.intra[node] = {
+                state: distance[state]
+                for state in self.entrances[cluster]
+                if state != node and state in distance
+            }
+
+
+class HPAStarSearch:
+    # Side length of a cluster in cells
+    CLUSTER_SIZE = 10
+
+    # Cached abstraction of every grid searched so far
+    abstractions: "WeakKeyDictionary[Grid, ClusterAbstraction]" = \
+        WeakKeyDictionary()
+
+    @staticmethod
+    def search(grid: Grid) -> Solution:
+        """Find path between two points in a grid using Hierarchical
+        Pathfinding A* (HPA*)
+
+        The grid is split into clusters whose transition cells form an
+        abstract graph. The graph is built once per grid and only dirty
+        clusters are rebuilt after edits. A query connects the start and
+        end to their clusters, searches the abstract graph and refines
+        the result into cells. Paths are near-optimal, not guaranteed
+        shortest.
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            Solution: Solution found
+        """
+        abstraction = HPAStarSearch.abstraction(grid)
+        explored = ClosedSet(grid.width * grid.height)
+
+        if grid.start == grid.end:
+            explored.add(grid.index(grid.start))
+            return Solution([grid.start], explored.positions(grid.width))
+
+        path = abstraction.find_path(grid, explored)
+
+        # Return empty Solution object for no solution
+        if path is None:
+            return NoSolution([], explored.positions(grid.width))
+
+        return Solution(
+            [grid.position(idx) for idx in path],
+            explored.positions(grid.width),
+            path_cost=sum(grid.costs[idx] for idx in path[1:])
+        )
+
+    @staticmethod
+    def abstraction(grid: Grid) -> ClusterAbstraction:
+        """Get the cached abstraction of a grid, creating it if needed
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            ClusterAbstraction: Abstraction kept up to date with the grid
+        """
+        abstraction = HPAStarSearch.abstractions.get(grid)
+
+        if abstraction is None:
+            abstraction = ClusterAbstraction(grid, HPAStarSearch.CLUSTER_SIZE)
+            grid.listeners.append(abstraction.mark_dirty)
+            HPAStarSearch.abstractions[grid] = abstraction
+
+        return abstraction
@@ -0,0 +1,229 @@
+from array import array
+
+from .astar import AStarSearch
+from ..models.closed_set import ClosedSet
+from ..models.frontier import PriorityQueueFrontier
+from ..models.grid import INFINITY, MOVES, Grid
+from ..models.solution import NoSolution, Solution
+
+# Direction of the start cell, which may be left in any direction
+NO_DIRECTION = 255
+
+
+class JumpPointSearch:
+    @staticmethod
+    def search(grid: Grid) -> Solution:
+        """Find path between two points in a grid using Jump Point Search
+
+        Paths are pruned to a canonical form where a horizontal move only
+        turns vertical if the cell diagonally behind it is blocked. So
+        only jump points (turns that are forced, and the cells they are
+        seen from) enter the open list. This needs every move to cost the
+        same, so grids with weighted cells are solved with A* instead.
+
+        The solution lists every scanned cell as explored and keeps the
+        expanded jump points in `jump_points`.
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            Solution: Solution found
+        """
+        if grid.max_cost() > 1:
+            return AStarSearch.search(grid)
+
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+        size = grid.width * grid.height
+
+        # Instantiate PriorityQueue frontier and add the source cell into it
+        h = AStarSearch.heuristic(grid.start, grid.end)
+        frontier = PriorityQueueFrontier()
+        frontier.add(start, priority=(h, h))
+
+        # Per-query bookkeeping; the grid itself is never modified
+        parents = array("i", [-1]) * size
+        g_score = array("I", [INFINITY]) * size
+        g_score[start] = 0
+
+        # Action that reached each jump point
+        directions = bytearray([NO_DIRECTION]) * size
+
+        # Cells touched by scans and expanded jump points, in order
+        explored = ClosedSet(size)
+        jump_points = ClosedSet(size)
+
+        while True:
+            # Return empty Solution object for no solution
+            if frontier.is_empty():
+                return NoSolution(
+                    [],
+                    explored.positions(grid.width),
+                    jump_points=jump_points.positions(grid.width)
+                )
+
+            # Remove node from the frontier
+            node = frontier.pop()
+            jump_points.add(node)
+            explored.add(node)
+
+            # If reached destination point
+            if node == end:
+
+                # Generate path and return a Solution object
+                cells = JumpPointSearch.expand_path(grid, parents, node)
+                path_cost = sum(grid.get_cost(cell) for cell in cells[1:])
+
+                return Solution(
+                    cells,
+                    explored.positions(grid.width),
+                    path_cost=path_cost,
+                    jump_points=jump_points.positions(grid.width)
+                )
+
+            # Jump in every direction that is not pruned
+            for action in JumpPointSearch.directions(
+                grid, node, directions[node]
+            ):
+                state = JumpPointSearch.jump(grid, node, action, end, explored)
+                if state == -1:
+                    continue
+
+                row, col = grid.position(state)
+                cost = g_score[node] + AStarSearch.heuristic(
+                    grid.position(node), (row, col)
+                )
+
+                if cost < g_score[state]:
+                    g_score[state] = cost
+                    parents[state] = node
+                    directions[state] = action
+
+                    h = AStarSearch.heuristic((row, col), grid.end)
+                    frontier.add(node=state, priority=(cost + h, h))
+
+    @staticmethod
+    def directions(grid: Grid, node: int, incoming: int) -> list[int]:
+        """Determine the directions to jump in from a jump point
+
+        Args:
+            grid (Grid): Grid of points
+            node (int): Index of the jump point
+            incoming (int): Action that reached the jump point
+
+        Returns:
+            list[int]: Action codes
+        """
+        if incoming == NO_DIRECTION:
+            return [0, 1, 2, 3]
+
+        # Vertical moves may always go on or turn
+        if MOVES[incoming][1] == 0:
+            return [incoming, 2, 3]
+
+        # Horizontal moves go on, or turn where the turn is forced
+        row, col = grid.position(node)
+        dc = MOVES[incoming][1]
+        actions = [incoming]
+
+        for action in (0, 1):
+            r = row + MOVES[action][0]
+            if JumpPointSearch.is_open(grid, r, col) \
+                    and not JumpPointSearch.is_open(grid, r, col - dc):
+                actions.append(action)
+
+        return actions
+
+    @staticmethod
+    def jump(
+        grid: Grid,
+        node: int,
+        action: int,
+        end: int,
+        scanned: ClosedSet
+    ) -> int:
+        """Scan in a straight line for the next jump point
+
+        Args:
+            grid (Grid): Grid of points
+            node (int): Index of the cell to scan from
+            action (int): Direction to scan in
+            end (int): Index of the destination cell
+            scanned (ClosedSet): Records every scanned cell
+
+        Returns:
+            int: Index of the jump point, -1 if there is none
+        """
+        dr, dc = MOVES[action]
+        row, col = grid.position(node)
+
+        while True:
+            row += dr
+            col += dc
+
+            if not JumpPointSearch.is_open(grid, row, col):
+                return -1
+
+            idx = row * grid.width + col
+            scanned.add(idx)
+
+            if idx == end:
+                return idx
+
+            if dr == 0:
+                # Horizontal: stop where a vertical turn is forced
+                for r in (row - 1, row + 1):
+                    if JumpPointSearch.is_open(grid, r, col) \
+                            and not JumpPointSearch.is_open(grid, r, col - dc):
+                        return idx
+            else:
+                # Vertical: stop where a horizontal scan finds a jump point
+                for turn in (2, 3):
+                    if JumpPointSearch.jump(grid, idx, turn, end, scanned) != -1:
+                        return idx
+
+    @staticmethod
+    def is_open(grid: Grid, row: int, col: int) -> bool:
+        """Check if a position is inside the grid and not a wall
+
+        Args:
+            grid (Grid): Grid of points
+            row (int): Row
+            col (int): Column
+
+        Returns:
+            bool: Whether the cell can be entered
+        """
+        return 0 <= row < grid.height and 0 <= col < grid.width \
+            and not grid.walls[row * grid.width + col]
+
+    @staticmethod
+    def expand_path(
+        grid: Grid,
+        parents: array,
+        idx: int
+    ) -> list[tuple[int, int]]:
+        """Generate the full path from the chain of jump points
+
+        Args:
+            grid (Grid): Grid of points
+            parents (array): Parent jump point of every jump point
+            idx (int): Index of the destination cell
+
+        Returns:
+            list[tuple[int, int]]: Every cell on the path
+        """
+        jump_points, _ = grid.get_path(parents, idx)
+        cells = jump_points[:1]
+
+        for (r1, c1), (r2, c2) in zip(jump_points, jump_points[1:]):
+            dr = (r2 > r1) - (r2 < r1)
+            dc = (c2 > c1) - (c2 < c1)
+
+            while (r1, c1) != (r2, c2):
+                r1 += dr
+                c1 += dc
+                cells.append((r1, c1))
+
+        return cells
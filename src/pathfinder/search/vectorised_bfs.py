@@ -0,0 +1,130 @@
+from typing import TYPE_CHECKING
+
+from ..models.grid import MOVES, Grid
+from ..models.solution import NoSolution, Solution
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class VectorisedBreadthFirstSearch:
+    @staticmethod
+    def search(grid: Grid) -> Solution:
+        """Find path between two points in a grid using Breadth First
+        Search, growing whole layers at once with NumPy
+
+        Every move counts as one step, weights are ignored.
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            Solution: Solution found
+        """
+        end = grid.index(grid.end)
+        distance, layers = VectorisedBreadthFirstSearch.distance_map(
+            grid, grid.index(grid.start), target=end
+        )
+
+        explored = [divmod(idx, grid.width)
+                    for layer in layers for idx in layer.tolist()]
+
+        # Return empty Solution object for no solution
+        if distance[grid.end] < 0:
+            return NoSolution([], explored)
+
+        # Step back from the end through cells one layer closer each time
+        cells = [grid.end]
+        row, col = grid.end
+
+        while distance[row, col] > 0:
+            for dr, dc in MOVES:
+                r, c = row + dr, col + dc
+
+                if 0 <= r < grid.height and 0 <= c < grid.width \
+                        and distance[r, c] == distance[row, col] - 1:
+                    row, col = r, c
+                    break
+
+            cells.append((row, col))
+
+        cells.reverse()
+
+        return Solution(
+            cells,
+            explored,
+            path_cost=sum(grid.get_cost(cell) for cell in cells[1:])
+        )
+
+    @staticmethod
+    def distance_map(
+        grid: Grid,
+        source: int,
+        target: int = -1
+    ) -> tuple["np.ndarray", list["np.ndarray"]]:
+        """Find the number of steps from a cell to every other cell
+
+        Each layer is grown from the previous one in a handful of array
+        operations: shift every cell of the layer one step in each
+        direction, mask out walls and reached cells and drop duplicates.
+
+        Args:
+            grid (Grid): Grid of points
+            source (int): Index of the cell to search from
+            target (int, optional): Stop after the layer that reaches
+            this cell. Defaults to -1.
+
+        Raises:
+            ImportError: NumPy is not installed
+
+        Returns:
+            tuple[np.ndarray, list[np.ndarray]]: Steps of every cell as a
+            (height, width) array, -1 where unreachable, and the indices
+            of the cells in every layer in exploration order
+        """
+        # Imported on first use, NumPy takes longer to import than most
+        # searches take to run
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "Vectorised BFS needs NumPy, install it with "
+                "'pip install numpy'"
+            ) from None
+
+        width = grid.width
+        size = grid.width * grid.height
+
+        # Cells that are neither walls nor reached yet
+        unvisited = np.frombuffer(grid.walls, dtype=np.uint8) == 0
+        distance = np.full(size, -1, dtype=np.int32)
+
+        layer = np.array([source], dtype=np.intp)
+        unvisited[source] = False
+        distance[source] = 0
+
+        layers = [layer]
+        depth = 0
+
+        while layer.size and not (target != -1 and distance[target] >= 0):
+            cols = layer % width
+
+            # Shift the layer one cell up, down, left and right
+            grown = np.concatenate((
+                layer[layer >= width] - width,
+                layer[layer < size - width] + width,
+                layer[cols > 0] - 1,
+                layer[cols < width - 1] + 1,
+            ))
+
+            # Sorting keeps every layer in row-major order
+            layer = np.unique(grown[unvisited[grown]])
+
+            depth += 1
+            unvisited[layer] = False
+            distance[layer] = depth
+
+            if layer.size:
+                layers.append(layer)
+
+        return distance.reshape(grid.height, width), layers
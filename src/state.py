@@ -1,3 +1,4 @@
+from src.pathfinder.main import SearchStream
 from src.pathfinder.models.solution import Solution
 from src.widgets import Label, Popup
 
@@ -14,6 +15,9 @@ class State:
     run_all_mazes = False
     results_popup: Popup | None = None
 
+    # Algorithm name and stream of the search whose progress is shown
+    search: tuple[str, SearchStream] | None = None
+
     def __new__(cls):
         if State.__instance is None:
             State.__instance = object.__new__(cls)